@@ -0,0 +1,236 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from FunctionParser import BooleanFunction
+
+MAX_VARIABLES = 5
+DEFAULT_CHUNK_SIZE = 1 << 24
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# Биты кода класса в порядке BooleanFunction.PROPERTY_NAMES: 0, 1, S, M, L
+CLASS_BITS = {prop_name: 1 << bit for bit, prop_name in enumerate(BooleanFunction.PROPERTY_NAMES)}
+NUM_CODES = 1 << len(CLASS_BITS)
+
+
+def _variable_masks(num_variables: int) -> List[np.uint64]:
+    """
+    Возвращает маски наборов, у которых j-я переменная равна 0.
+
+    Args:
+        num_variables: Количество переменных
+
+    Returns:
+        Список масок длины 2^n бит для каждой переменной
+    """
+    length = 1 << num_variables
+    masks = []
+    for j in range(num_variables):
+        mask = sum(1 << x for x in range(length) if not (x >> j) & 1)
+        masks.append(np.uint64(mask))
+    return masks
+
+
+def classify_functions(functions: np.ndarray, num_variables: int) -> np.ndarray:
+    """
+    Вычисляет коды принадлежности функций к классам Поста битовыми операциями.
+
+    Функция задается целым числом, i-й бит которого равен f на наборе с
+    номером i (то же, что символ vector[i] в BooleanFunction).
+
+    Args:
+        functions: Массив uint64 с номерами функций
+        num_variables: Количество переменных (не более MAX_VARIABLES)
+
+    Returns:
+        Массив uint8 с кодами классов (биты CLASS_BITS)
+    """
+    f = np.asarray(functions, dtype=np.uint64)
+    length = 1 << num_variables
+    full = np.uint64((1 << length) - 1)
+    zero = np.uint64(0)
+    one = np.uint64(1)
+    masks = _variable_masks(num_variables)
+
+    codes = np.zeros(f.shape, dtype=np.uint8)
+    codes[(f & one) == zero] |= CLASS_BITS['is_zero_preserving']
+    codes[((f >> np.uint64(length - 1)) & one) == one] |= CLASS_BITS['is_one_preserving']
+
+    # Самодвойственность: f(x) != f(~x), ~x получаем перестановкой половин по каждой переменной
+    dual = f.copy()
+    monotonic = np.ones(f.shape, dtype=bool)
+    anf = f.copy()
+    affine_mask = 1
+    for j, mask in enumerate(masks):
+        shift = np.uint64(1 << j)
+        dual = ((dual & mask) << shift) | ((dual >> shift) & mask)
+        # Монотонность: нет наборов x с x_j = 0, где f(x) = 1, а f(x | e_j) = 0
+        monotonic &= (f & ~(f >> shift) & mask) == zero
+        # Преобразование Мёбиуса даёт коэффициенты полинома Жегалкина
+        anf ^= (anf & mask) << shift
+        affine_mask |= 1 << (1 << j)
+
+    codes[(f ^ dual) == full] |= CLASS_BITS['is_self_dual']
+    codes[monotonic] |= CLASS_BITS['is_monotonic']
+    codes[(anf & ~np.uint64(affine_mask) & full) == zero] |= CLASS_BITS['is_linear']
+
+    return codes
+
+
+def census_range(num_variables: int, start: int, stop: int,
+                 block_size: int = DEFAULT_BLOCK_SIZE) -> np.ndarray:
+    """
+    Подсчитывает распределение кодов классов для функций с номерами [start, stop).
+
+    Args:
+        num_variables: Количество переменных
+        start: Номер первой функции
+        stop: Номер, следующий за последней функцией
+        block_size: Количество функций, обрабатываемых за один векторный проход
+
+    Returns:
+        Массив int64 длины NUM_CODES с количеством функций для каждого кода
+    """
+    counts = np.zeros(NUM_CODES, dtype=np.int64)
+    for block_start in range(start, stop, block_size):
+        block_stop = min(block_start + block_size, stop)
+        functions = np.arange(block_start, block_stop, dtype=np.uint64)
+        codes = classify_functions(functions, num_variables)
+        counts += np.bincount(codes, minlength=NUM_CODES)
+    return counts
+
+
+class ClassCensus:
+    """
+    Полный перебор всех 2^(2^n) булевых функций с подсчетом классов Поста.
+
+    Диапазон номеров делится на блоки (chunk), которые могут считаться
+    в пуле процессов. После каждого блока состояние сохраняется в файл
+    контрольной точки, поэтому прерванный подсчет можно продолжить.
+
+    Attributes:
+        num_variables: Количество переменных
+        total_functions: Общее количество функций 2^(2^n)
+        counts: Количество функций для каждого кода пересечения классов
+    """
+
+    def __init__(self, num_variables: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 checkpoint_file: Optional[str] = None):
+        if not 0 <= num_variables <= MAX_VARIABLES:
+            raise ValueError(f"Количество переменных должно быть от 0 до {MAX_VARIABLES}")
+        if chunk_size <= 0:
+            raise ValueError("Размер блока должен быть положительным числом")
+
+        self.num_variables = num_variables
+        self.total_functions = 1 << (1 << num_variables)
+        self.chunk_size = chunk_size
+        self.checkpoint_file = checkpoint_file
+        self.counts = np.zeros(NUM_CODES, dtype=np.int64)
+        self.done_chunks = set()
+        self._load_checkpoint()
+
+    @property
+    def num_chunks(self) -> int:
+        """Количество блоков, на которые разбит перебор."""
+        return -(-self.total_functions // self.chunk_size)
+
+    def _chunk_range(self, chunk: int) -> tuple:
+        """Возвращает диапазон номеров функций блока."""
+        start = chunk * self.chunk_size
+        return start, min(start + self.chunk_size, self.total_functions)
+
+    def _load_checkpoint(self) -> None:
+        """Восстанавливает состояние из файла контрольной точки, если он есть."""
+        if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
+            return
+
+        with open(self.checkpoint_file, 'r') as file:
+            state = json.load(file)
+
+        if state['num_variables'] != self.num_variables or state['chunk_size'] != self.chunk_size:
+            raise ValueError("Контрольная точка создана для других параметров перебора")
+
+        self.counts = np.array(state['counts'], dtype=np.int64)
+        self.done_chunks = set(state['done_chunks'])
+
+    def _save_checkpoint(self) -> None:
+        """Атомарно записывает текущее состояние в файл контрольной точки."""
+        if not self.checkpoint_file:
+            return
+
+        state = {
+            'num_variables': self.num_variables,
+            'chunk_size': self.chunk_size,
+            'counts': self.counts.tolist(),
+            'done_chunks': sorted(self.done_chunks)
+        }
+        temp_file = self.checkpoint_file + '.tmp'
+        with open(temp_file, 'w') as file:
+            json.dump(state, file)
+        os.replace(temp_file, self.checkpoint_file)
+
+    def _record_chunk(self, chunk: int, counts: np.ndarray) -> None:
+        """Добавляет результат блока и сохраняет контрольную точку."""
+        self.counts += counts
+        self.done_chunks.add(chunk)
+        self._save_checkpoint()
+
+    def run(self, workers: int = 1) -> np.ndarray:
+        """
+        Выполняет (или продолжает) перебор.
+
+        Args:
+            workers: Количество процессов; 1 - считать в текущем процессе
+
+        Returns:
+            Массив количеств функций для каждого кода пересечения классов
+        """
+        pending = [chunk for chunk in range(self.num_chunks) if chunk not in self.done_chunks]
+
+        if workers <= 1:
+            for chunk in pending:
+                self._record_chunk(chunk, census_range(self.num_variables, *self._chunk_range(chunk)))
+            return self.counts.copy()
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(census_range, self.num_variables, *self._chunk_range(chunk)): chunk
+                for chunk in pending
+            }
+            for future in as_completed(futures):
+                self._record_chunk(futures[future], future.result())
+
+        return self.counts.copy()
+
+    def is_complete(self) -> bool:
+        """Проверяет, обработаны ли все блоки."""
+        return len(self.done_chunks) == self.num_chunks
+
+    def get_class_totals(self) -> Dict[str, int]:
+        """Возвращает количество функций в каждом классе Поста."""
+        codes = np.arange(NUM_CODES)
+        return {
+            prop_name: int(self.counts[(codes & bit) != 0].sum())
+            for prop_name, bit in CLASS_BITS.items()
+        }
+
+    def get_intersection_counts(self) -> Dict[str, int]:
+        """
+        Возвращает количество функций для каждого пересечения классов.
+
+        Returns:
+            Словарь вида {'01SML': количество, ...}; ключ '-' означает,
+            что функция не принадлежит ни одному классу
+        """
+        result = {}
+        for code in range(NUM_CODES):
+            if self.counts[code]:
+                key = "".join(
+                    BooleanFunction.PROPERTY_NAMES[prop_name]
+                    for prop_name, bit in CLASS_BITS.items() if code & bit
+                ) or '-'
+                result[key] = int(self.counts[code])
+        return result
@@ -1,5 +1,7 @@
 from typing import Dict, List
 
+from WalshSpectrum import pack_vectors, spectral_properties
+
 
 class BooleanFunction:
     """
@@ -20,11 +22,20 @@ class BooleanFunction:
         'is_linear': 'L'
     }
 
+    # Спектральные свойства (по преобразованию Уолша-Адамара)
+    SPECTRAL_PROPERTY_NAMES = {
+        'nonlinearity': 'NL',
+        'is_balanced': 'B',
+        'correlation_immunity': 'CI',
+        'resiliency': 'R'
+    }
+
     def __init__(self, vector: str):
         self.vector = vector
         self.num_variables = self._calculate_num_variables()
         self._validate_vector()
         self.properties = self._calculate_all_properties()
+        self.spectral_properties = self._calculate_spectral_properties()
 
     def _calculate_num_variables(self) -> int:
         """Вычисляет количество переменных на основе длины вектора."""
@@ -111,6 +122,14 @@ class BooleanFunction:
             'is_linear': self.is_linear() if self.num_variables == 3 else False
         }
 
+    def _calculate_spectral_properties(self) -> Dict[str, int]:
+        """Вычисляет спектральные свойства функции."""
+        spectral = spectral_properties(pack_vectors(self.vector))
+        return {
+            prop_name: spectral[prop_name][0].item()
+            for prop_name in self.SPECTRAL_PROPERTY_NAMES.keys()
+        }
+
     def get_property_display(self) -> str:
         """
         Возвращает строку для отображения свойств функции.
@@ -127,6 +146,10 @@ class BooleanFunction:
         """Возвращает словарь со всеми свойствами функции."""
         return self.properties.copy()
 
+    def get_spectral_properties_dict(self) -> Dict[str, int]:
+        """Возвращает словарь со спектральными свойствами функции."""
+        return self.spectral_properties.copy()
+
     def __str__(self) -> str:
         """Строковое представление функции."""
         return f"BooleanFunction(vector='{self.vector}', vars={self.num_variables})"
@@ -202,3 +225,10 @@ class FunctionAnalyzer:
                 value = func.properties[prop_name]
                 status = "ДА" if value else "НЕТ"
                 print(f"  {prop_symbol} ({prop_name}): {status}")
+
+            print("Спектральные свойства:")
+            for prop_name, prop_symbol in BooleanFunction.SPECTRAL_PROPERTY_NAMES.items():
+                value = func.spectral_properties[prop_name]
+                if isinstance(value, bool):
+                    value = "ДА" if value else "НЕТ"
+                print(f"  {prop_symbol} ({prop_name}): {value}")
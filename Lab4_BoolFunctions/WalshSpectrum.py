@@ -0,0 +1,101 @@
+from typing import Dict
+
+import numpy as np
+
+
+def pack_vectors(vectors) -> np.ndarray:
+    """
+    Упаковывает векторы значений функций в массив NumPy.
+
+    Args:
+        vectors: Строка вида '0110' или последовательность таких строк
+
+    Returns:
+        Массив uint8 формы (количество функций, 2^n) из нулей и единиц
+    """
+    if isinstance(vectors, str):
+        vectors = [vectors]
+
+    packed = np.array([np.frombuffer(vector.encode('ascii'), dtype=np.uint8) for vector in vectors])
+    return (packed - ord('0')).astype(np.uint8)
+
+
+def walsh_hadamard_transform(vectors: np.ndarray) -> np.ndarray:
+    """
+    Быстрое преобразование Уолша-Адамара за O(n * 2^n) для пакета функций.
+
+    Каждая строка входного массива - таблица истинности f, результат -
+    спектр W_f(w) = sum_x (-1)^(f(x) xor <w, x>).
+
+    Args:
+        vectors: Массив формы (количество функций, 2^n) из нулей и единиц
+
+    Returns:
+        Массив int64 той же формы со спектрами Уолша
+    """
+    spectrum = 1 - 2 * np.atleast_2d(vectors).astype(np.int64)
+    batch, length = spectrum.shape
+    if length & (length - 1):
+        raise ValueError(f"Длина вектора должна быть степенью двойки, получено {length}")
+
+    half = 1
+    while half < length:
+        # Бабочка для переменной с весом half: (a, b) -> (a + b, a - b)
+        blocks = spectrum.reshape(batch, -1, 2, half)
+        low = blocks[:, :, 0, :].copy()
+        high = blocks[:, :, 1, :]
+        blocks[:, :, 0, :] += high
+        blocks[:, :, 1, :] = low - high
+        half *= 2
+
+    return spectrum
+
+
+def _weights_of_indices(length: int) -> np.ndarray:
+    """Возвращает вес Хэмминга каждого индекса 0..length-1."""
+    indices = np.arange(length)
+    weights = np.zeros(length, dtype=np.int64)
+    while indices.any():
+        weights += indices & 1
+        indices = indices >> 1
+    return weights
+
+
+def spectral_properties(vectors: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Вычисляет спектральные (криптографические) свойства пакета функций.
+
+    Args:
+        vectors: Массив формы (количество функций, 2^n) из нулей и единиц
+
+    Returns:
+        Словарь массивов длины "количество функций":
+        nonlinearity - нелинейность 2^(n-1) - max|W|/2,
+        is_balanced - уравновешенность (W(0) = 0),
+        correlation_immunity - наибольший порядок корреляционной иммунности,
+        resiliency - порядок устойчивости (-1, если функция не уравновешена)
+    """
+    spectrum = walsh_hadamard_transform(vectors)
+    length = spectrum.shape[1]
+    num_variables = length.bit_length() - 1
+
+    nonlinearity = length // 2 - np.abs(spectrum).max(axis=1) // 2
+    is_balanced = spectrum[:, 0] == 0
+
+    # Порядок корреляционной иммунности - наибольшее m, при котором
+    # W(w) = 0 для всех w с весом 1..m
+    weights = _weights_of_indices(length)
+    nonzero = spectrum != 0
+    correlation_immunity = np.full(spectrum.shape[0], num_variables, dtype=np.int64)
+    for weight in range(num_variables, 0, -1):
+        violated = nonzero[:, weights == weight].any(axis=1)
+        correlation_immunity[violated] = weight - 1
+
+    resiliency = np.where(is_balanced, correlation_immunity, -1)
+
+    return {
+        'nonlinearity': nonlinearity,
+        'is_balanced': is_balanced,
+        'correlation_immunity': correlation_immunity,
+        'resiliency': resiliency
+    }
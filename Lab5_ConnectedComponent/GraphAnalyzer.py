@@ -1,8 +1,11 @@
 import numpy as np
 
-from utils import binarize_matrix
+from GraphLoader import CSRGraph, load_dense_matrix, load_edge_list, is_edge_list_file
+from Reachability import ReachabilityClosure
+from SparseGraph import (connected_component_labels, labels_to_components,
+                         strongly_connected_component_labels, condensation, topological_order)
 
-from typing import Tuple, List, Set
+from typing import Tuple, List, Set, Optional
 
 class GraphAnalyzer:
     """
@@ -11,39 +14,50 @@ class GraphAnalyzer:
 
     def __init__(self, filename: str):
         self.filename = filename
-        self.matrix = self._read_matrix_from_file()
-        self.num_vertices = len(self.matrix)
+        self._matrix = None
+        self.graph = self._read_graph_from_file()
+        self.num_vertices = self.graph.num_vertices
+        self._reachability_matrix = None
+        self._scc_labels = None
 
-    def _read_matrix_from_file(self) -> np.ndarray:
+    def _read_graph_from_file(self) -> CSRGraph:
         """
-        Читает матрицу смежности из файла и устанавливает диагональные элементы в 1.
+        Читает граф из файла: список ребер (.edges, .el, .npy) или матрицу смежности.
+
+        Списки ребер сразу строятся в формате CSR без плотной матрицы,
+        память O(n + m).
 
         Returns:
-            Матрица смежности как numpy array
+            Граф в формате CSR
 
         Raises:
             FileNotFoundError: если файл не найден
             ValueError: если данные в файле некорректны
         """
-        try:
-            with open(self.filename, 'r') as file:
-                matrix = []
-                for line in file:
-                    row = list(map(int, line.split()))
-                    matrix.append(row)
+        if is_edge_list_file(self.filename):
+            return load_edge_list(self.filename)
 
-            # Преобразуем в numpy array для удобства операций
-            matrix = np.array(matrix, dtype=int)
+        matrix = load_dense_matrix(self.filename)
 
-            # Устанавливаем диагональ в 1 (каждая вершина связана сама с собой)
-            np.fill_diagonal(matrix, 1)
+        # Устанавливаем диагональ в 1 (каждая вершина связана сама с собой)
+        np.fill_diagonal(matrix, 1)
+        self._matrix = matrix
 
-            return matrix
+        return CSRGraph.from_dense(matrix)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        Матрица смежности с единичной диагональю.
 
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Файл {self.filename} не найден")
-        except ValueError:
-            raise ValueError("Некорректный формат данных в файле")
+        Для графа из списка ребер строится при первом обращении.
+        """
+        if self._matrix is None:
+            matrix = np.zeros((self.num_vertices, self.num_vertices), dtype=int)
+            matrix[self.graph.sources(), self.graph.indices] = 1
+            np.fill_diagonal(matrix, 1)
+            self._matrix = matrix
+        return self._matrix
 
     def _compute_reachability_matrix(self) -> np.ndarray:
         """
@@ -52,42 +66,76 @@ class GraphAnalyzer:
         Returns:
             Матрица достижимости
         """
-        reachability_matrix = self.matrix.copy()
+        return self.get_reachability().to_dense()
 
-        # Суммируем степени матрицы смежности до n-1
-        for power in range(2, self.num_vertices + 1):
-            reachability_matrix += np.linalg.matrix_power(self.matrix, power)
+    def get_reachability(self, output_file: Optional[str] = None) -> ReachabilityClosure:
+        """
+        Вычисляет транзитивное замыкание графа в упакованном виде (1 бит на пару).
 
-        return binarize_matrix(reachability_matrix)
+        Подходит для больших графов, для которых плотная матрица не помещается в память.
 
-    def _find_connected_components(self, reachability_matrix: np.ndarray) -> List[Set[int]]:
+        Args:
+            output_file: Файл для хранения битовых строк через np.memmap
+
+        Returns:
+            Объект ReachabilityClosure с итераторами по достижимым вершинам
+        """
+        return ReachabilityClosure(self.graph, output_file)
+
+    @property
+    def reachability_matrix(self) -> np.ndarray:
+        """Матрица достижимости, вычисляемая при первом обращении."""
+        if self._reachability_matrix is None:
+            self._reachability_matrix = self._compute_reachability_matrix()
+        return self._reachability_matrix
+
+    def _find_connected_components(self) -> List[Set[int]]:
         """
         Находит компоненты связности графа.
 
-        Args:
-            reachability_matrix: Матрица достижимости
+        Для неориентированного графа компоненты находятся обходом в ширину,
+        для ориентированного - это компоненты сильной связности. В обоих
+        случаях время O(n + m), матрица достижимости не строится.
 
         Returns:
             Список компонент связности (каждая компонента - множество вершин)
         """
-        # Находим уникальные строки матрицы достижимости
-        unique_rows = np.unique(reachability_matrix, axis=0)
+        if self.graph.is_symmetric():
+            return labels_to_components(connected_component_labels(self.graph))
+
+        return self.find_strongly_connected_components()
+
+    def get_scc_labels(self) -> np.ndarray:
+        """
+        Возвращает номер компоненты сильной связности для каждой вершины.
 
-        components = []
-        used_vertices = set()
+        Returns:
+            Массив меток (нумерация вершин с 0), метки идут в топологическом
+            порядке графа конденсации
+        """
+        if self._scc_labels is None:
+            self._scc_labels = strongly_connected_component_labels(self.graph)
+        return self._scc_labels
 
-        for row in unique_rows:
-            component = set()
-            for vertex in range(self.num_vertices):
-                # Если вершина достижима из текущей компоненты
-                if reachability_matrix[vertex].tolist() == row.tolist():
-                    component.add(vertex + 1)  # +1 для нумерации с 1
-                    used_vertices.add(vertex)
+    def find_strongly_connected_components(self) -> List[Set[int]]:
+        """
+        Находит компоненты сильной связности графа.
 
-            if component:
-                components.append(component)
+        Returns:
+            Список компонент (множества вершин с нумерацией с 1)
+            в топологическом порядке графа конденсации
+        """
+        return labels_to_components(self.get_scc_labels())
 
-        return components
+    def get_condensation(self) -> Tuple[CSRGraph, np.ndarray]:
+        """
+        Строит граф конденсации (граф компонент сильной связности).
+
+        Returns:
+            Кортеж (граф конденсации в формате CSR, топологический порядок его вершин)
+        """
+        dag = condensation(self.graph, self.get_scc_labels())
+        return dag, topological_order(dag)
 
     def _get_connectivity_components_matrix(self, components: List[Set[int]]) -> List[List[int]]:
         """
@@ -107,18 +155,21 @@ class GraphAnalyzer:
 
         return component_matrix
 
-    def analyze(self) -> Tuple[np.ndarray, List[Set[int]]]:
+    def analyze(self, with_reachability: bool = True) -> Tuple[Optional[np.ndarray], List[Set[int]]]:
         """
         Выполняет полный анализ графа.
 
+        Args:
+            with_reachability: Вычислять ли матрицу достижимости
+
         Returns:
-            Кортеж (матрица достижимости, список компонент связности)
+            Кортеж (матрица достижимости или None, список компонент связности)
         """
-        # Вычисляем матрицу достижимости
-        reachability_matrix = self._compute_reachability_matrix()
-
         # Находим компоненты связности
-        components = self._find_connected_components(reachability_matrix)
+        components = self._find_connected_components()
+
+        # Матрица достижимости вычисляется только по запросу
+        reachability_matrix = self.reachability_matrix if with_reachability else None
 
         return reachability_matrix, components
 
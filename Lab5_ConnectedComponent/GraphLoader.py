@@ -0,0 +1,236 @@
+import os
+from typing import Optional
+
+import numpy as np
+
+EDGE_LIST_EXTENSIONS = ('.edges', '.el')
+BINARY_EXTENSIONS = ('.npy',)
+
+
+class CSRGraph:
+    """
+    Граф в сжатом строчном формате (CSR).
+
+    Соседи вершины v - это indices[indptr[v]:indptr[v + 1]], веса
+    соответствующих дуг - weights в том же диапазоне. Память O(n + m).
+
+    Attributes:
+        num_vertices: Количество вершин
+        indptr: Массив смещений длины n + 1
+        indices: Массив концов дуг длины m
+        weights: Массив весов дуг длины m
+    """
+
+    def __init__(self, num_vertices: int, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        self.num_vertices = num_vertices
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, sources: np.ndarray, targets: np.ndarray,
+                   weights: Optional[np.ndarray] = None) -> 'CSRGraph':
+        """
+        Строит граф по массивам начал и концов дуг (нумерация с 0).
+
+        Args:
+            num_vertices: Количество вершин
+            sources: Начала дуг
+            targets: Концы дуг
+            weights: Веса дуг (по умолчанию все равны 1)
+
+        Returns:
+            Граф в формате CSR
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if weights is None:
+            weights = np.ones(len(sources), dtype=np.int64)
+        weights = np.asarray(weights)
+
+        order = np.argsort(sources, kind='stable')
+        counts = np.bincount(sources, minlength=num_vertices)
+        indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        return cls(num_vertices, indptr, targets[order], weights[order])
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray) -> 'CSRGraph':
+        """
+        Строит граф по плотной матрице смежности (ненулевой элемент - дуга).
+
+        Args:
+            matrix: Квадратная матрица смежности
+
+        Returns:
+            Граф в формате CSR
+        """
+        matrix = np.asarray(matrix)
+        sources, targets = np.nonzero(matrix)
+        return cls.from_edges(len(matrix), sources, targets, matrix[sources, targets])
+
+    @property
+    def num_edges(self) -> int:
+        """Количество дуг графа."""
+        return len(self.indices)
+
+    def neighbors(self, vertex: int) -> np.ndarray:
+        """Возвращает концы дуг, выходящих из вершины."""
+        return self.indices[self.indptr[vertex]:self.indptr[vertex + 1]]
+
+    def sources(self) -> np.ndarray:
+        """Возвращает начало каждой дуги в порядке хранения."""
+        return np.repeat(np.arange(self.num_vertices, dtype=np.int64), np.diff(self.indptr))
+
+    def transpose(self) -> 'CSRGraph':
+        """Возвращает граф с обращенными дугами."""
+        return CSRGraph.from_edges(self.num_vertices, self.indices, self.sources(), self.weights)
+
+    def symmetrized(self) -> 'CSRGraph':
+        """Возвращает неориентированную версию графа (каждая дуга в обе стороны)."""
+        sources = self.sources()
+        return CSRGraph.from_edges(
+            self.num_vertices,
+            np.concatenate([sources, self.indices]),
+            np.concatenate([self.indices, sources]),
+            np.concatenate([self.weights, self.weights])
+        )
+
+    def is_symmetric(self) -> bool:
+        """Проверяет, что для каждой дуги (u, v) есть дуга (v, u)."""
+        forward = self.sources() * self.num_vertices + self.indices
+        backward = self.indices * self.num_vertices + self.sources()
+        return np.array_equal(np.sort(forward), np.sort(backward))
+
+
+def load_dense_matrix(filename: str) -> np.ndarray:
+    """
+    Читает плотную матрицу смежности из текстового файла.
+
+    Args:
+        filename: Путь к файлу, строки матрицы разделены переводом строки
+
+    Returns:
+        Квадратная матрица смежности
+
+    Raises:
+        FileNotFoundError: если файл не найден
+        ValueError: если данные в файле некорректны
+    """
+    if not os.path.exists(filename):
+        raise FileNotFoundError(f"Файл {filename} не найден")
+
+    try:
+        matrix = np.loadtxt(filename, dtype=np.int64, ndmin=2)
+    except ValueError:
+        raise ValueError("Некорректный формат данных в файле")
+
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Матрица смежности должна быть квадратной")
+
+    return matrix
+
+
+def _read_edge_array(filename: str) -> np.ndarray:
+    """Читает массив ребер (m, 2) или (m, 3) из текстового или .npy файла."""
+    if not os.path.exists(filename):
+        raise FileNotFoundError(f"Файл {filename} не найден")
+
+    try:
+        if filename.endswith(BINARY_EXTENSIONS):
+            edges = np.load(filename, mmap_mode='r')
+        else:
+            edges = np.loadtxt(filename, dtype=np.int64, ndmin=2, comments='#')
+    except ValueError:
+        raise ValueError("Некорректный формат данных в файле")
+
+    if edges.size == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    if edges.ndim != 2 or edges.shape[1] not in (2, 3):
+        raise ValueError("Строка списка ребер должна иметь вид 'u v' или 'u v вес'")
+
+    return edges
+
+
+def load_edge_list(filename: str, num_vertices: Optional[int] = None,
+                   directed: bool = True, one_based: bool = True) -> CSRGraph:
+    """
+    Читает граф из списка ребер.
+
+    Текстовый файл содержит строки 'u v' или 'u v вес' (строки с '#' -
+    комментарии). Файл .npy содержит целочисленный массив формы (m, 2)
+    или (m, 3) и отображается в память без разбора строк.
+
+    Args:
+        filename: Путь к файлу
+        num_vertices: Количество вершин (по умолчанию - наибольший номер вершины)
+        directed: Если False, каждое ребро добавляется в обе стороны
+        one_based: Нумеруются ли вершины в файле с 1
+
+    Returns:
+        Граф в формате CSR
+
+    Raises:
+        FileNotFoundError: если файл не найден
+        ValueError: если данные в файле некорректны
+    """
+    edges = _read_edge_array(filename)
+    offset = 1 if one_based else 0
+    sources = np.asarray(edges[:, 0], dtype=np.int64) - offset
+    targets = np.asarray(edges[:, 1], dtype=np.int64) - offset
+    weights = np.asarray(edges[:, 2], dtype=np.int64) if edges.shape[1] == 3 else None
+
+    if len(sources) and min(sources.min(), targets.min()) < 0:
+        raise ValueError("Номер вершины вне допустимого диапазона")
+
+    max_vertex = int(max(sources.max(), targets.max())) + 1 if len(sources) else 0
+    if num_vertices is None:
+        num_vertices = max_vertex
+    elif max_vertex > num_vertices:
+        raise ValueError("Номер вершины вне допустимого диапазона")
+
+    if not directed:
+        sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+        if weights is not None:
+            weights = np.concatenate([weights, weights])
+
+    return CSRGraph.from_edges(num_vertices, sources, targets, weights)
+
+
+def save_edge_list(graph: CSRGraph, filename: str, one_based: bool = True) -> None:
+    """
+    Сохраняет дуги графа в двоичный файл .npy (массив (m, 3): u, v, вес).
+
+    Args:
+        graph: Граф в формате CSR
+        filename: Путь к файлу .npy
+        one_based: Нумеровать ли вершины с 1
+    """
+    offset = 1 if one_based else 0
+    edges = np.column_stack([graph.sources() + offset, graph.indices + offset, graph.weights])
+    np.save(filename, edges.astype(np.int64))
+
+
+def is_edge_list_file(filename: str) -> bool:
+    """Проверяет по расширению, что файл содержит список ребер, а не матрицу."""
+    return filename.endswith(EDGE_LIST_EXTENSIONS + BINARY_EXTENSIONS)
+
+
+def load_graph(filename: str, directed: bool = True) -> CSRGraph:
+    """
+    Читает граф из файла любого поддерживаемого формата.
+
+    Файлы .edges/.el/.npy читаются как список ребер, остальные - как
+    плотная матрица смежности.
+
+    Args:
+        filename: Путь к файлу
+        directed: Если False, ребра списка добавляются в обе стороны
+
+    Returns:
+        Граф в формате CSR
+    """
+    if is_edge_list_file(filename):
+        return load_edge_list(filename, directed=directed)
+    return CSRGraph.from_dense(load_dense_matrix(filename))
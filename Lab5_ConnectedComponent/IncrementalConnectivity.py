@@ -0,0 +1,207 @@
+from itertools import islice
+from typing import Iterable, Iterator, Tuple
+
+import numpy as np
+
+from GraphLoader import BINARY_EXTENSIONS
+
+DEFAULT_BATCH_SIZE = 1 << 16
+
+
+class IncrementalConnectivity:
+    """
+    Компоненты связности графа, к которому по одному добавляются ребра.
+
+    Система непересекающихся множеств со сжатием путей и объединением
+    по размеру: каждая операция выполняется за почти константное время,
+    пересчет всего графа после новой порции ребер не нужен.
+    Вершины нумеруются с 0, массив вершин растет по мере появления новых номеров.
+
+    Attributes:
+        component_count: Текущее количество компонент связности
+    """
+
+    def __init__(self, num_vertices: int = 0):
+        self._parent = list(range(num_vertices))
+        self._size = [1] * num_vertices
+        self.component_count = num_vertices
+
+    @property
+    def num_vertices(self) -> int:
+        """Количество известных вершин."""
+        return len(self._parent)
+
+    @staticmethod
+    def _check_vertices(u: int, v: int) -> None:
+        """Отклоняет отрицательные номера: в массивах они указали бы на вершины с конца."""
+        if min(u, v) < 0:
+            raise ValueError(f"Некорректный номер вершины: {min(u, v)}")
+
+    def _ensure_vertex(self, vertex: int) -> None:
+        """Добавляет изолированные вершины до номера vertex включительно."""
+        if vertex < 0:
+            raise ValueError(f"Некорректный номер вершины: {vertex}")
+
+        if vertex >= len(self._parent):
+            added = vertex + 1 - len(self._parent)
+            self._parent.extend(range(len(self._parent), vertex + 1))
+            self._size.extend([1] * added)
+            self.component_count += added
+
+    def find(self, vertex: int) -> int:
+        """Возвращает представителя компоненты вершины (со сжатием пути)."""
+        parent = self._parent
+        root = vertex
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[vertex] != root:
+            parent[vertex], vertex = root, parent[vertex]
+
+        return root
+
+    def add_edge(self, u: int, v: int) -> bool:
+        """
+        Добавляет ребро (u, v).
+
+        Returns:
+            True, если ребро объединило две разные компоненты
+
+        Raises:
+            ValueError: если номер вершины отрицателен
+        """
+        self._check_vertices(u, v)
+        self._ensure_vertex(max(u, v))
+        root_u = self.find(u)
+        root_v = self.find(v)
+        if root_u == root_v:
+            return False
+
+        # Меньшая компонента подвешивается к большей
+        if self._size[root_u] < self._size[root_v]:
+            root_u, root_v = root_v, root_u
+        self._parent[root_v] = root_u
+        self._size[root_u] += self._size[root_v]
+        self.component_count -= 1
+        return True
+
+    def add_edges(self, edges: Iterable[Tuple[int, int]]) -> int:
+        """
+        Добавляет порцию ребер.
+
+        Args:
+            edges: Пары (u, v) или массив формы (m, 2)
+
+        Returns:
+            Количество компонент после добавления
+
+        Raises:
+            ValueError: если номер вершины отрицателен
+        """
+        if isinstance(edges, np.ndarray):
+            if len(edges):
+                self._check_vertices(int(edges[:, :2].min()), 0)
+                self._ensure_vertex(int(edges[:, :2].max()))
+            edges = edges[:, :2].tolist()
+
+        for u, v in edges:
+            self.add_edge(u, v)
+
+        return self.component_count
+
+    def consume(self, batches: Iterable[Iterable[Tuple[int, int]]]) -> Iterator[int]:
+        """
+        Обрабатывает поток порций ребер.
+
+        Args:
+            batches: Последовательность порций ребер
+
+        Yields:
+            Количество компонент после каждой порции
+        """
+        for batch in batches:
+            yield self.add_edges(batch)
+
+    def connected(self, u: int, v: int) -> bool:
+        """Проверяет, лежат ли вершины в одной компоненте."""
+        self._check_vertices(u, v)
+        if max(u, v) >= self.num_vertices:
+            return u == v
+        return self.find(u) == self.find(v)
+
+    def component_size(self, vertex: int) -> int:
+        """Возвращает размер компоненты, содержащей вершину."""
+        self._check_vertices(vertex, vertex)
+        if vertex >= self.num_vertices:
+            return 1
+        return self._size[self.find(vertex)]
+
+    def labels(self) -> np.ndarray:
+        """
+        Возвращает снимок разбиения на компоненты.
+
+        Returns:
+            Массив номеров компонент для каждой вершины; компоненты
+            пронумерованы в порядке наименьших вершин
+        """
+        parent = np.array(self._parent, dtype=np.int64)
+
+        # Удвоение указателей: после log(глубины) шагов все указывают на корни
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+        _, first_seen, inverse = np.unique(parent, return_index=True, return_inverse=True)
+        rank = np.empty(len(first_seen), dtype=np.int64)
+        rank[np.argsort(first_seen)] = np.arange(len(first_seen))
+        return rank[inverse.reshape(-1)]
+
+
+def iter_edge_batches(filename: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                      one_based: bool = True) -> Iterator[np.ndarray]:
+    """
+    Читает список ребер порциями, не загружая файл целиком.
+
+    Args:
+        filename: Текстовый файл со строками 'u v [вес]' или файл .npy
+        batch_size: Количество ребер в порции
+        one_based: Нумеруются ли вершины в файле с 1
+
+    Yields:
+        Массивы формы (batch_size, 2) с вершинами, нумерация с 0
+
+    Raises:
+        ValueError: если номер вершины меньше 1 (или 0 при one_based=False)
+    """
+    offset = 1 if one_based else 0
+
+    if filename.endswith(BINARY_EXTENSIONS):
+        edges = np.load(filename, mmap_mode='r')
+        for start in range(0, len(edges), batch_size):
+            yield _shift_batch(np.asarray(edges[start:start + batch_size, :2], dtype=np.int64), offset)
+        return
+
+    with open(filename, 'r') as file:
+        while True:
+            chunk = list(islice(file, batch_size))
+            if not chunk:
+                return
+
+            lines = [line for line in chunk if line.strip() and not line.startswith('#')]
+            if not lines:
+                continue
+
+            try:
+                batch = np.loadtxt(lines, dtype=np.int64, ndmin=2)
+            except ValueError:
+                raise ValueError("Некорректный формат данных в файле")
+            yield _shift_batch(batch[:, :2], offset)
+
+
+def _shift_batch(batch: np.ndarray, offset: int) -> np.ndarray:
+    """Переводит номера вершин порции к нумерации с 0, отклоняя номера меньше offset."""
+    if len(batch) and batch.min() < offset:
+        raise ValueError(f"Некорректный номер вершины: {int(batch.min())}, нумерация начинается с {offset}")
+    return batch - offset
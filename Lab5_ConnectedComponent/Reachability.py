@@ -0,0 +1,107 @@
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from GraphLoader import CSRGraph
+from SparseGraph import strongly_connected_component_labels, condensation
+
+WORD_BITS = 64
+COUNT_BLOCK_BITS = 1 << 24
+
+
+class ReachabilityClosure:
+    """
+    Транзитивное (рефлексивное) замыкание графа в виде битовых строк.
+
+    Граф сжимается в граф конденсации, затем строки достижимости
+    компонент вычисляются в обратном топологическом порядке как
+    побитовое ИЛИ строк преемников. Строка хранит 1 бит на вершину
+    (упакованные uint64) и общая для всех вершин одной компоненты,
+    поэтому память - k * n / 8 байт, где k - число компонент.
+
+    Attributes:
+        num_vertices: Количество вершин
+        labels: Номер компоненты сильной связности для каждой вершины
+        rows: Массив (k, ceil(n / 64)) uint64 со строками достижимости
+    """
+
+    def __init__(self, graph: CSRGraph, output_file: Optional[str] = None):
+        """
+        Args:
+            graph: Ориентированный граф в формате CSR
+            output_file: Файл для хранения строк через np.memmap
+                (по умолчанию строки хранятся в памяти)
+        """
+        self.num_vertices = graph.num_vertices
+        self.labels = strongly_connected_component_labels(graph)
+        self.num_words = -(-self.num_vertices // WORD_BITS)
+
+        dag = condensation(graph, self.labels)
+        shape = (dag.num_vertices, self.num_words)
+        if output_file:
+            self.rows = np.memmap(output_file, dtype=np.uint64, mode='w+', shape=shape)
+        else:
+            self.rows = np.zeros(shape, dtype=np.uint64)
+
+        self._propagate(dag)
+
+    def _propagate(self, dag: CSRGraph) -> None:
+        """Заполняет строки компонент от стоков к истокам."""
+        # Каждая компонента достижима из самой себя
+        vertices = np.arange(self.num_vertices)
+        bits = np.left_shift(np.uint64(1), (vertices % WORD_BITS).astype(np.uint64))
+        np.bitwise_or.at(self.rows, (self.labels, vertices // WORD_BITS), bits)
+
+        # Метки идут в топологическом порядке: преемники имеют большие номера
+        for component in range(dag.num_vertices - 1, -1, -1):
+            successors = dag.neighbors(component)
+            if len(successors):
+                self.rows[component] |= np.bitwise_or.reduce(self.rows[successors], axis=0)
+
+        if isinstance(self.rows, np.memmap):
+            self.rows.flush()
+
+    def row(self, vertex: int) -> np.ndarray:
+        """
+        Возвращает строку матрицы достижимости вершины (нумерация с 0).
+
+        Returns:
+            Булев массив длины n
+        """
+        packed = np.ascontiguousarray(self.rows[self.labels[vertex]])
+        unpacked = np.unpackbits(packed.view(np.uint8), bitorder='little')
+        return unpacked[:self.num_vertices].astype(bool)
+
+    def is_reachable(self, source: int, target: int) -> bool:
+        """Проверяет, достижима ли вершина target из вершины source (нумерация с 0)."""
+        word = self.rows[self.labels[source], target // WORD_BITS]
+        return bool((int(word) >> (target % WORD_BITS)) & 1)
+
+    def iter_reachable(self, vertex: int) -> Iterator[int]:
+        """Перебирает вершины, достижимые из заданной (нумерация с 0)."""
+        yield from np.flatnonzero(self.row(vertex)).tolist()
+
+    def iter_pairs(self) -> Iterator[Tuple[int, int]]:
+        """Перебирает все пары (u, v), где v достижима из u (нумерация с 0)."""
+        for source in range(self.num_vertices):
+            for target in self.iter_reachable(source):
+                yield source, target
+
+    def count_reachable(self) -> np.ndarray:
+        """Возвращает количество достижимых вершин для каждой вершины."""
+        counts = np.zeros(len(self.rows), dtype=np.int64)
+        block = max(1, COUNT_BLOCK_BITS // max(1, self.num_vertices))
+        for start in range(0, len(self.rows), block):
+            chunk = np.ascontiguousarray(self.rows[start:start + block]).view(np.uint8)
+            counts[start:start + block] = np.unpackbits(chunk, axis=1).sum(axis=1)
+        return counts[self.labels]
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Разворачивает замыкание в обычную матрицу достижимости.
+
+        Returns:
+            Матрица n x n из 0 и 1 (только для небольших графов)
+        """
+        unpacked = np.unpackbits(np.ascontiguousarray(self.rows).view(np.uint8), axis=1, bitorder='little')
+        return unpacked[self.labels, :self.num_vertices].astype(int)
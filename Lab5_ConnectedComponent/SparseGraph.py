@@ -0,0 +1,184 @@
+from collections import deque
+from typing import List, Set
+
+import numpy as np
+
+from GraphLoader import CSRGraph
+
+
+def connected_component_labels(graph: CSRGraph) -> np.ndarray:
+    """
+    Находит компоненты связности обходом в ширину за O(n + m).
+
+    Направление дуг не учитывается (для ориентированного графа это
+    компоненты слабой связности).
+
+    Args:
+        graph: Граф в формате CSR
+
+    Returns:
+        Массив меток: номер компоненты для каждой вершины; компоненты
+        пронумерованы в порядке наименьших вершин
+    """
+    undirected = graph.symmetrized()
+    indptr = undirected.indptr.tolist()
+    indices = undirected.indices.tolist()
+    labels = [-1] * graph.num_vertices
+    num_components = 0
+
+    for start in range(graph.num_vertices):
+        if labels[start] != -1:
+            continue
+
+        labels[start] = num_components
+        queue = deque([start])
+        while queue:
+            vertex = queue.popleft()
+            for neighbor in indices[indptr[vertex]:indptr[vertex + 1]]:
+                if labels[neighbor] == -1:
+                    labels[neighbor] = num_components
+                    queue.append(neighbor)
+
+        num_components += 1
+
+    return np.array(labels, dtype=np.int64)
+
+
+def labels_to_components(labels: np.ndarray) -> List[Set[int]]:
+    """
+    Преобразует массив меток в список множеств вершин (нумерация с 1).
+
+    Args:
+        labels: Номер компоненты для каждой вершины
+
+    Returns:
+        Список компонент в порядке номеров меток
+    """
+    order = np.argsort(labels, kind='stable')
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+    return [set((group + 1).tolist()) for group in np.split(order, boundaries) if len(group)]
+
+
+def strongly_connected_component_labels(graph: CSRGraph) -> np.ndarray:
+    """
+    Находит компоненты сильной связности итеративным алгоритмом Тарьяна за O(n + m).
+
+    Рекурсия заменена явным стеком (вершина, позиция в списке соседей),
+    поэтому глубина графа не ограничена стеком интерпретатора.
+
+    Args:
+        graph: Ориентированный граф в формате CSR
+
+    Returns:
+        Массив меток компонент; метки пронумерованы в топологическом
+        порядке графа конденсации (дуги идут от меньших меток к большим)
+    """
+    num_vertices = graph.num_vertices
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+
+    index = [-1] * num_vertices
+    low = [0] * num_vertices
+    on_stack = [False] * num_vertices
+    labels = [-1] * num_vertices
+    stack = []
+    counter = 0
+    num_components = 0
+
+    for root in range(num_vertices):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, indptr[root])]
+
+        while work:
+            vertex, position = work[-1]
+            end = indptr[vertex + 1]
+
+            while position < end:
+                neighbor = indices[position]
+                position += 1
+                if index[neighbor] == -1:
+                    # Спускаемся в непосещенного соседа
+                    work[-1] = (vertex, position)
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = True
+                    work.append((neighbor, indptr[neighbor]))
+                    break
+                if on_stack[neighbor] and index[neighbor] < low[vertex]:
+                    low[vertex] = index[neighbor]
+            else:
+                # Все соседи обработаны - возвращаемся к родителю
+                work.pop()
+                if low[vertex] == index[vertex]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        labels[member] = num_components
+                        if member == vertex:
+                            break
+                    num_components += 1
+
+                if work:
+                    parent = work[-1][0]
+                    if low[vertex] < low[parent]:
+                        low[parent] = low[vertex]
+
+    # Тарьян выдает компоненты в обратном топологическом порядке
+    return num_components - 1 - np.array(labels, dtype=np.int64)
+
+
+def condensation(graph: CSRGraph, labels: np.ndarray) -> CSRGraph:
+    """
+    Строит граф конденсации: вершины - компоненты, без петель и кратных дуг.
+
+    Args:
+        graph: Исходный граф в формате CSR
+        labels: Номер компоненты для каждой вершины
+
+    Returns:
+        Граф конденсации в формате CSR
+    """
+    num_components = int(labels.max()) + 1 if len(labels) else 0
+    source_labels = labels[graph.sources()]
+    target_labels = labels[graph.indices]
+    between = source_labels != target_labels
+
+    keys = np.unique(source_labels[between] * num_components + target_labels[between])
+    return CSRGraph.from_edges(num_components, keys // num_components, keys % num_components)
+
+
+def topological_order(graph: CSRGraph) -> np.ndarray:
+    """
+    Возвращает топологический порядок вершин ациклического графа (алгоритм Кана).
+
+    Args:
+        graph: Ориентированный ациклический граф в формате CSR
+
+    Returns:
+        Массив вершин в топологическом порядке
+
+    Raises:
+        ValueError: если граф содержит цикл
+    """
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    in_degree = np.bincount(graph.indices, minlength=graph.num_vertices).tolist()
+
+    order = [vertex for vertex in range(graph.num_vertices) if in_degree[vertex] == 0]
+    for vertex in order:
+        for neighbor in indices[indptr[vertex]:indptr[vertex + 1]]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                order.append(neighbor)
+
+    if len(order) != graph.num_vertices:
+        raise ValueError("Граф содержит цикл, топологический порядок не существует")
+
+    return np.array(order, dtype=np.int64)
@@ -0,0 +1,173 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Меньше этого числа дуг за раунд пул процессов не используется
+MIN_PARALLEL_ARCS = 1 << 20
+
+
+def _edge_keys(weights: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Строит уникальные ключи ребер, упорядоченные по (вес, номер ребра).
+
+    Уникальность ключей исключает циклы при одновременном выборе ребер.
+
+    Returns:
+        Кортеж (ключи, таблица декодирования); если таблица None, номер
+        ребра равен ключу по модулю числа ребер
+    """
+    num_edges = len(weights)
+    if np.issubdtype(weights.dtype, np.integer) and num_edges:
+        low = int(weights.min())
+        span = int(weights.max()) - low + 1
+        if span * num_edges < (1 << 62):
+            return (weights.astype(np.int64) - low) * num_edges + np.arange(num_edges), None
+
+    # Запасной вариант для вещественных весов: ранг в глобальной сортировке
+    order = np.argsort(weights, kind='stable')
+    keys = np.empty(num_edges, dtype=np.int64)
+    keys[order] = np.arange(num_edges)
+    return keys, order
+
+
+def _attach(name: str, shape: tuple, dtype) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Подключается к массиву в разделяемой памяти."""
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _segment_min_worker(keys_name: str, num_arcs: int, starts_name: str, num_segments: int,
+                        out_name: str, first: int, last: int) -> None:
+    """Вычисляет минимумы сегментов [first, last) в разделяемой памяти."""
+    blocks = []
+    try:
+        block, keys = _attach(keys_name, (num_arcs,), np.int64)
+        blocks.append(block)
+        block, starts = _attach(starts_name, (num_segments,), np.int64)
+        blocks.append(block)
+        block, out = _attach(out_name, (num_segments,), np.int64)
+        blocks.append(block)
+
+        begin = starts[first]
+        end = starts[last] if last < num_segments else num_arcs
+        out[first:last] = np.minimum.reduceat(keys[begin:end], starts[first:last] - begin)
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def _to_shared(array: np.ndarray) -> shared_memory.SharedMemory:
+    """Копирует массив в новый блок разделяемой памяти."""
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    return block
+
+
+def _segment_min(keys: np.ndarray, starts: np.ndarray, executor: Optional[ProcessPoolExecutor],
+                 workers: int) -> np.ndarray:
+    """
+    Минимум ключа в каждом сегменте [starts[i], starts[i + 1]).
+
+    При наличии пула сегменты делятся между процессами на диапазоны
+    с примерно равным числом дуг, массивы передаются через разделяемую память.
+    """
+    if executor is None or len(keys) < MIN_PARALLEL_ARCS:
+        return np.minimum.reduceat(keys, starts)
+
+    num_segments = len(starts)
+    bounds = np.searchsorted(starts, np.linspace(0, len(keys), workers + 1)[1:-1])
+    bounds = np.unique(np.concatenate([[0], bounds, [num_segments]]))
+
+    blocks = [_to_shared(keys), _to_shared(starts), _to_shared(np.empty(num_segments, dtype=np.int64))]
+    try:
+        futures = [
+            executor.submit(_segment_min_worker, blocks[0].name, len(keys), blocks[1].name,
+                            num_segments, blocks[2].name, int(first), int(last))
+            for first, last in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+        return np.ndarray((num_segments,), dtype=np.int64, buffer=blocks[2].buf).copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def boruvka(num_vertices: int, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray,
+            workers: int = 1) -> np.ndarray:
+    """
+    Алгоритм Борувки: каждая компонента выбирает самое легкое исходящее ребро,
+    затем компоненты стягиваются. Не более log n раундов, каждый - векторный
+    проход по дугам (np.minimum.reduceat по сегментам компонент).
+
+    Args:
+        num_vertices: Количество вершин (номера вершин меньше этого числа)
+        sources: Первые концы ребер
+        targets: Вторые концы ребер
+        weights: Веса ребер
+        workers: Количество процессов для поиска минимумов по сегментам
+
+    Returns:
+        Индексы ребер, вошедших в минимальный остовный лес
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    keys, decode = _edge_keys(np.asarray(weights))
+    num_edges = len(keys)
+
+    components = np.arange(num_vertices, dtype=np.int64)
+    alive = np.arange(num_edges, dtype=np.int64)
+    selected: List[np.ndarray] = []
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while True:
+            # Ребра внутри одной компоненты больше не нужны
+            comp_u = components[sources[alive]]
+            comp_v = components[targets[alive]]
+            between = comp_u != comp_v
+            alive, comp_u, comp_v = alive[between], comp_u[between], comp_v[between]
+            if not len(alive):
+                break
+
+            # Дуги в обе стороны, сгруппированные по компоненте начала
+            arc_components = np.concatenate([comp_u, comp_v])
+            arc_edges = np.concatenate([alive, alive])
+            order = np.argsort(arc_components)
+            arc_components = arc_components[order]
+            arc_keys = keys[arc_edges[order]]
+
+            starts = np.flatnonzero(np.concatenate([[True], arc_components[1:] != arc_components[:-1]]))
+            best_keys = _segment_min(arc_keys, starts, executor, workers)
+            best_edges = best_keys % num_edges if decode is None else decode[best_keys]
+            segment_components = arc_components[starts]
+
+            # Стягивание: каждая компонента указывает на компоненту за своим ребром
+            ends_u = components[sources[best_edges]]
+            ends_v = components[targets[best_edges]]
+            parent = np.arange(components.max() + 1, dtype=np.int64)
+            parent[segment_components] = np.where(ends_u == segment_components, ends_v, ends_u)
+
+            # Единственные циклы - пары, выбравшие одно ребро; корнем становится меньшая
+            mutual = (parent[parent] == np.arange(len(parent))) & (np.arange(len(parent)) < parent)
+            parent[mutual] = np.flatnonzero(mutual)
+
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+
+            selected.append(np.unique(best_edges))
+
+            # Перенумерация корней подряд без сортировки
+            is_root = parent == np.arange(len(parent))
+            components = (np.cumsum(is_root) - 1)[parent[components]]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return np.concatenate(selected) if selected else np.zeros(0, dtype=np.int64)
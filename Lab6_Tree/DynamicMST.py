@@ -0,0 +1,250 @@
+import time
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from utils import EDGE_DTYPE, to_edge_array, find_minimum_spanning_tree
+
+
+class DynamicMST:
+    """
+    Минимальный остовный лес, поддерживаемый при изменениях графа.
+
+    Начальное дерево строится алгоритмом Краскала, дальше каждое
+    изменение обрабатывается локально:
+    - вставка ребра - свойство цикла: новое ребро заменяет самое тяжелое
+      ребро пути между его концами в дереве, если оно легче;
+    - удаление ребра дерева - поиск самого легкого ребра, соединяющего
+      две получившиеся части (обходится меньшая часть);
+    - изменение веса сводится к двум предыдущим случаям.
+    Вершины нумеруются с 1, как в GraphProcessor.
+
+    Attributes:
+        latencies: Список (операция, время в секундах) для каждого изменения
+    """
+
+    def __init__(self, edges):
+        edge_array = to_edge_array(edges)
+
+        self.adjacency: Dict[int, Dict[int, int]] = {}
+        self.tree: Dict[int, Dict[int, int]] = {}
+        self.latencies: List[Tuple[str, float]] = []
+
+        for weight, v1, v2 in edge_array.tolist():
+            self._add_graph_edge(v1, v2, weight)
+
+        for weight, v1, v2 in find_minimum_spanning_tree(self.get_graph_edges()).tolist():
+            self._link(v1, v2, weight)
+
+    def _add_graph_edge(self, v1: int, v2: int, weight: int) -> None:
+        """Добавляет ребро в граф (из кратных ребер хранится самое легкое)."""
+        if v1 == v2:
+            return
+        current = self.adjacency.get(v1, {}).get(v2)
+        if current is None or weight < current:
+            self.adjacency.setdefault(v1, {})[v2] = weight
+            self.adjacency.setdefault(v2, {})[v1] = weight
+
+    def _link(self, v1: int, v2: int, weight: int) -> None:
+        """Добавляет ребро в дерево."""
+        self.tree.setdefault(v1, {})[v2] = weight
+        self.tree.setdefault(v2, {})[v1] = weight
+
+    def _cut(self, v1: int, v2: int) -> None:
+        """Удаляет ребро из дерева."""
+        del self.tree[v1][v2]
+        del self.tree[v2][v1]
+
+    def _is_tree_edge(self, v1: int, v2: int) -> bool:
+        """Проверяет, входит ли ребро в дерево."""
+        return v2 in self.tree.get(v1, {})
+
+    def _tree_path(self, source: int, target: int) -> Optional[List[int]]:
+        """Возвращает путь между вершинами в дереве или None, если они в разных деревьях."""
+        parents = {source: None}
+        queue = deque([source])
+        while queue:
+            vertex = queue.popleft()
+            if vertex == target:
+                path = [target]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                return path
+            for neighbor in self.tree.get(vertex, {}):
+                if neighbor not in parents:
+                    parents[neighbor] = vertex
+                    queue.append(neighbor)
+        return None
+
+    def _tree_side(self, start: int, limit: int) -> Tuple[Set[int], bool]:
+        """
+        Собирает вершины дерева, содержащего start, но не более limit.
+
+        Returns:
+            Кортеж (множество вершин, полностью ли обойдена компонента)
+        """
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            vertex = queue.popleft()
+            for neighbor in self.tree.get(vertex, {}):
+                if neighbor not in seen:
+                    if len(seen) >= limit:
+                        return seen, False
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+        return seen, True
+
+    def _smaller_side(self, v1: int, v2: int) -> Set[int]:
+        """Возвращает меньшую из частей дерева, содержащих v1 и v2 (после разреза)."""
+        # Обход чередуется, чтобы остановиться на размере меньшей части
+        limit = 1
+        while True:
+            side1, complete1 = self._tree_side(v1, limit)
+            if complete1:
+                return side1
+            side2, complete2 = self._tree_side(v2, limit)
+            if complete2:
+                return side2
+            limit *= 2
+
+    def _reconnect(self, v1: int, v2: int) -> None:
+        """Ищет самое легкое ребро между частями, содержащими v1 и v2, и добавляет его в дерево."""
+        side = self._smaller_side(v1, v2)
+        best = None
+        for vertex in side:
+            for neighbor, weight in self.adjacency.get(vertex, {}).items():
+                if neighbor not in side and (best is None or weight < best[0]):
+                    best = (weight, vertex, neighbor)
+
+        if best is not None:
+            weight, a, b = best
+            self._link(a, b, weight)
+
+    def _apply_cycle_property(self, v1: int, v2: int, weight: int) -> None:
+        """Добавляет ребро в дерево, если оно легче самого тяжелого ребра цикла."""
+        path = self._tree_path(v1, v2)
+        if path is None:
+            # Ребро соединяет два разных дерева леса
+            self._link(v1, v2, weight)
+            return
+
+        heaviest = max(zip(path, path[1:]), key=lambda pair: self.tree[pair[0]][pair[1]])
+        if self.tree[heaviest[0]][heaviest[1]] > weight:
+            self._cut(*heaviest)
+            self._link(v1, v2, weight)
+
+    def _timed(self, operation: str, started: float) -> float:
+        """Записывает время выполнения операции."""
+        elapsed = time.perf_counter() - started
+        self.latencies.append((operation, elapsed))
+        return elapsed
+
+    def insert_edge(self, v1: int, v2: int, weight: int) -> float:
+        """
+        Добавляет ребро в граф.
+
+        Returns:
+            Время обновления в секундах
+        """
+        started = time.perf_counter()
+        current = self.adjacency.get(v1, {}).get(v2)
+        if v1 != v2 and (current is None or weight < current):
+            if current is None:
+                self._add_graph_edge(v1, v2, weight)
+                self._apply_cycle_property(v1, v2, weight)
+            else:
+                # Более легкая копия существующего ребра - уменьшение его веса
+                self._change_weight(v1, v2, weight)
+        return self._timed('insert', started)
+
+    def delete_edge(self, v1: int, v2: int) -> float:
+        """
+        Удаляет ребро из графа.
+
+        Returns:
+            Время обновления в секундах
+
+        Raises:
+            KeyError: если ребра нет в графе
+        """
+        started = time.perf_counter()
+        if v2 not in self.adjacency.get(v1, {}):
+            raise KeyError(f"Ребро ({v1}, {v2}) отсутствует в графе")
+
+        del self.adjacency[v1][v2]
+        del self.adjacency[v2][v1]
+        if self._is_tree_edge(v1, v2):
+            self._cut(v1, v2)
+            self._reconnect(v1, v2)
+
+        return self._timed('delete', started)
+
+    def update_weight(self, v1: int, v2: int, weight: int) -> float:
+        """
+        Изменяет вес существующего ребра.
+
+        Returns:
+            Время обновления в секундах
+
+        Raises:
+            KeyError: если ребра нет в графе
+        """
+        started = time.perf_counter()
+        if v2 not in self.adjacency.get(v1, {}):
+            raise KeyError(f"Ребро ({v1}, {v2}) отсутствует в графе")
+
+        self._change_weight(v1, v2, weight)
+        return self._timed('update', started)
+
+    def _change_weight(self, v1: int, v2: int, weight: int) -> None:
+        """Меняет вес существующего ребра и восстанавливает минимальность леса."""
+        old_weight = self.adjacency[v1][v2]
+        self.adjacency[v1][v2] = self.adjacency[v2][v1] = weight
+
+        if self._is_tree_edge(v1, v2):
+            self.tree[v1][v2] = self.tree[v2][v1] = weight
+            if weight > old_weight:
+                # Ребро дерева потяжелело - возможно, его заменит ребро разреза
+                self._cut(v1, v2)
+                self._reconnect(v1, v2)
+        elif weight < old_weight:
+            self._apply_cycle_property(v1, v2, weight)
+
+    def get_graph_edges(self) -> np.ndarray:
+        """Возвращает все ребра графа массивом EDGE_DTYPE."""
+        edges = [
+            (weight, v1, v2)
+            for v1, neighbors in self.adjacency.items()
+            for v2, weight in neighbors.items() if v1 < v2
+        ]
+        return np.array(edges, dtype=EDGE_DTYPE)
+
+    def get_tree_edges(self) -> np.ndarray:
+        """Возвращает ребра текущего остовного леса массивом EDGE_DTYPE."""
+        edges = [
+            (weight, v1, v2)
+            for v1, neighbors in self.tree.items()
+            for v2, weight in neighbors.items() if v1 < v2
+        ]
+        return np.array(edges, dtype=EDGE_DTYPE)
+
+    def total_weight(self) -> int:
+        """Возвращает суммарный вес остовного леса."""
+        return sum(
+            weight
+            for v1, neighbors in self.tree.items()
+            for v2, weight in neighbors.items() if v1 < v2
+        )
+
+    def measure_full_recompute(self) -> float:
+        """
+        Замеряет время полного пересчета дерева алгоритмом Краскала для сравнения.
+
+        Returns:
+            Время в секундах
+        """
+        started = time.perf_counter()
+        find_minimum_spanning_tree(self.get_graph_edges())
+        return time.perf_counter() - started
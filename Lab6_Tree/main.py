@@ -1,4 +1,7 @@
+import numpy as np
+
 from utils import *
+from utils import CSRGraph, load_dense_matrix, load_edge_list, is_edge_list_file
 
 
 class GraphProcessor:
@@ -7,49 +10,85 @@ class GraphProcessor:
     def __init__(self, filename: str):
         self.filename = filename
         self.matrix = []
+        self.graph = None
         self.size = 0
 
     def read_matrix_from_file(self) -> List[List[int]]:
         """Читает матрицу смежности из файла"""
         try:
-            with open(self.filename, 'r') as file:
-                self.matrix = []
-                for line in file:
-                    row = list(map(int, line.strip().split()))
-                    self.matrix.append(row)
-
-                self.size = len(self.matrix)
-                self._set_diagonal_to_ones()
-                return self.matrix
-
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Файл {self.filename} не найден")
+            self.matrix = load_dense_matrix(self.filename).tolist()
         except ValueError:
             raise ValueError("Ошибка при преобразовании данных в числа")
 
+        self.size = len(self.matrix)
+        self._set_diagonal_to_ones()
+        return self.matrix
+
+    def read_graph_from_file(self) -> CSRGraph:
+        """
+        Читает граф в формате CSR: список ребер (.edges, .el, .npy) или матрицу смежности.
+
+        Список ребер не разворачивается в матрицу, память O(n + m).
+        """
+        if is_edge_list_file(self.filename):
+            self.graph = load_edge_list(self.filename, directed=False)
+        else:
+            # Петли от единичной диагонали в граф не включаются
+            matrix = np.array(self.read_matrix_from_file())
+            np.fill_diagonal(matrix, 0)
+            self.graph = CSRGraph.from_dense(matrix)
+
+        self.size = self.graph.num_vertices
+        return self.graph
+
     def _set_diagonal_to_ones(self) -> None:
         """Устанавливает диагональные элементы в 1"""
         for i in range(self.size):
             self.matrix[i][i] = 1
 
-    def create_edges_list(self) -> List[Tuple[int, int, int]]:
-        """Создает список ребер в формате (вес, вершина1, вершина2)"""
-        edges = []
-        for i in range(self.size):
-            for j in range(i + 1, self.size):  # j > i исключает дубликаты
-                weight = self.matrix[i][j]
-                if weight != 0:
-                    edges.append((weight, i + 1, j + 1))
+    def create_edges_list(self) -> np.ndarray:
+        """
+        Создает массив ребер EDGE_DTYPE (вес, вершина1, вершина2)
+
+        Ребра берутся из верхнего треугольника матрицы (j > i исключает
+        дубликаты) или, если граф прочитан в формате CSR, из его дуг с u < v.
+        """
+        if self.graph is not None:
+            sources = self.graph.sources()
+            upper = sources < self.graph.indices
+            rows, cols = sources[upper], self.graph.indices[upper]
+            weights = self.graph.weights[upper]
+        else:
+            matrix = np.asarray(self.matrix, dtype=np.int64).reshape(self.size, self.size)
+            rows, cols = np.nonzero(np.triu(matrix, 1))
+            weights = matrix[rows, cols]
+
+        edges = np.empty(len(rows), dtype=EDGE_DTYPE)
+        edges['weight'] = weights
+        edges['v1'] = rows + 1
+        edges['v2'] = cols + 1
         return edges
 
-    def create_mst_matrix(self, mst_edges: List[Tuple[int, int, int]]) -> List[List[int]]:
-        """Создает матрицу смежности для минимального остовного дерева"""
-        mst_matrix = [[0 for _ in range(self.size)] for _ in range(self.size)]
-
-        for weight, v1, v2 in mst_edges:
-            mst_matrix[v1 - 1][v2 - 1] = weight
-            # Для неориентированного графа добавляем симметричный элемент
-            mst_matrix[v2 - 1][v1 - 1] = weight
+    def create_mst_adjacency(self, mst_edges: np.ndarray) -> CSRGraph:
+        """Создает разреженную (CSR) матрицу смежности дерева, память O(n)"""
+        mst_edges = to_edge_array(mst_edges)
+        v1, v2 = mst_edges['v1'] - 1, mst_edges['v2'] - 1
+        return CSRGraph.from_edges(
+            self.size,
+            np.concatenate([v1, v2]),
+            np.concatenate([v2, v1]),
+            np.concatenate([mst_edges['weight'], mst_edges['weight']])
+        )
+
+    def create_mst_matrix(self, mst_edges: np.ndarray) -> np.ndarray:
+        """Создает плотную матрицу смежности для минимального остовного дерева (для вывода)"""
+        mst_edges = to_edge_array(mst_edges)
+        mst_matrix = np.zeros((self.size, self.size), dtype=np.int64)
+
+        v1, v2 = mst_edges['v1'] - 1, mst_edges['v2'] - 1
+        mst_matrix[v1, v2] = mst_edges['weight']
+        # Для неориентированного графа добавляем симметричный элемент
+        mst_matrix[v2, v1] = mst_edges['weight']
 
         return mst_matrix
 
@@ -75,13 +114,15 @@ def main():
         print(f"\nСписок ребер: {edges}")
 
         # Сортировка ребер по весу
-        sorted_edges = sorted(edges, key=lambda x: x[0])
+        sorted_edges = np.sort(edges, order='weight', kind='stable')
         print(f"Отсортированные ребра: {sorted_edges}")
 
         # Построение минимального остовного дерева
-        choice = int(input("Выберите метод построения дерева (1 - метод Прима, 2 - метод Краскала)"))
+        choice = int(input("Выберите метод построения дерева (1 - метод Прима, 2 - метод Краскала, 3 - метод Борувки)"))
         if choice == 1:
-            mst_edges = find_minimum_spanning_tree(edges)
+            mst_edges = find_minimum_spanning_tree_primm(edges)
+        elif choice == 3:
+            mst_edges = find_minimum_spanning_tree_boruvka(edges)
         else:
             mst_edges = find_minimum_spanning_tree(edges)
 
@@ -91,9 +132,9 @@ def main():
         print("\nМатрица минимального остовного дерева:")
         print_matrix(mst_matrix)
 
-        # Вычисление и вывод суммы
-        matrix_sum = calculate_matrix_sum(mst_matrix)
-        print(f"\nСумма элементов матрицы: {matrix_sum}")
+        # Вес дерева считается по массиву ребер, без матрицы
+        tree_weight = calculate_tree_weight(mst_edges)
+        print(f"\nВес минимального остовного дерева: {tree_weight}")
 
     except Exception as e:
         print(f"Ошибка: {e}")
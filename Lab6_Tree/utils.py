@@ -1,35 +1,77 @@
+import heapq
 import os
-from typing import List, Tuple, Set, Dict
+import sys
+from typing import List, Tuple
 
-def calculate_matrix_sum(matrix: List[List[int]]) -> int:
-    """Вычисляет сумму всех элементов матрицы"""
-    return sum(sum(row) for row in matrix)
+import numpy as np
 
+# Загрузчик графов общий с Lab5: модуль GraphLoader берется оттуда, а не копируется.
+# Остальные модули Lab6 импортируют его имена из utils, а не из GraphLoader
+LAB5_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Lab5_ConnectedComponent')
+if LAB5_DIR not in sys.path:
+    sys.path.append(LAB5_DIR)
 
-def _merge_groups(v1: int, v2: int, groups: Dict) -> None:
-    """Объединяет две группы вершин"""
-    group1 = groups[v1].copy()
-    groups[v1].extend(groups[v2])
-    groups[v2].extend(group1)
+from GraphLoader import CSRGraph, load_dense_matrix, load_edge_list, is_edge_list_file
+from Boruvka import boruvka
 
+# Плотность графа, начиная с которой Прим выполняется по матрице весов
+DENSE_GRAPH_THRESHOLD = 0.25
 
-def _union_vertices(v1: int, v2: int, groups: Dict) -> None:
-    """Объединяет вершины в одну компоненту связности"""
-    if v1 not in groups and v2 not in groups:
-        group = [v1, v2]
-        groups[v1] = group
-        groups[v2] = group
-    elif v1 not in groups:
-        groups[v2].append(v1)
-        groups[v1] = groups[v2]
-    else:
-        groups[v1].append(v2)
-        groups[v2] = groups[v1]
+# Ребро графа (вес, вершина1, вершина2), вершины нумеруются с 1
+EDGE_DTYPE = np.dtype([('weight', np.int64), ('v1', np.int64), ('v2', np.int64)])
+
+class DisjointSet:
+    """Система непересекающихся множеств на массивах (сжатие путей делением пополам, объединение по рангу)"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+
+    def find(self, vertex: int) -> int:
+        """Возвращает представителя множества, сокращая путь вдвое"""
+        parent = self.parent
+        while parent[vertex] != vertex:
+            parent[vertex] = parent[parent[vertex]]
+            vertex = parent[vertex]
+        return vertex
+
+    def union(self, v1: int, v2: int) -> bool:
+        """Объединяет множества вершин, возвращает False, если они уже совпадают"""
+        root1 = self.find(v1)
+        root2 = self.find(v2)
+        if root1 == root2:
+            return False
+
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+        return True
 
 
-def _should_add_edge(v1: int, v2: int, connected: Set[int], groups: Dict) -> bool:
-    """Проверяет, можно ли добавить ребро без создания цикла"""
-    return v1 not in connected or v2 not in connected
+def to_edge_array(edges) -> np.ndarray:
+    """
+    Приводит ребра (список кортежей или структурный массив) к массиву EDGE_DTYPE
+
+    Raises:
+        ValueError: если вес ребра не целый - EDGE_DTYPE хранит веса в int64,
+            и дробная часть была бы молча отброшена
+    """
+    if isinstance(edges, np.ndarray) and edges.dtype == EDGE_DTYPE:
+        return edges
+    rows = [tuple(edge) for edge in edges]
+    weights = np.array([row[0] for row in rows])
+    if weights.dtype.kind not in 'iub' and len(weights):
+        numeric = weights.dtype.kind == 'f' and np.isfinite(weights).all()
+        if not numeric or (weights != np.round(weights)).any():
+            raise ValueError("Веса ребер должны быть целыми числами")
+    return np.array(rows, dtype=EDGE_DTYPE)
+
+
+def calculate_tree_weight(mst_edges) -> int:
+    """Вычисляет суммарный вес дерева прямо по массиву ребер"""
+    return int(to_edge_array(mst_edges)['weight'].sum())
 
 
 def print_matrix(matrix: List[List[int]]) -> None:
@@ -38,71 +80,189 @@ def print_matrix(matrix: List[List[int]]) -> None:
         print(' '.join(f'{val:2d}' for val in row))
 
 
-def find_minimum_spanning_tree(edges: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
-    """Находит минимальное остовное дерево алгоритмом Краскала"""
-    sorted_edges = sorted(edges, key=lambda x: x[0])
-    connected_vertices = set()
-    vertex_groups = {}
-    mst_edges = []
+def kruskal(num_vertices: int, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Алгоритм Краскала над массивами ребер, O(m log m)
 
-    # Первый проход - соединение компонент
-    for weight, v1, v2 in sorted_edges:
-        if _should_add_edge(v1, v2, connected_vertices, vertex_groups):
-            _union_vertices(v1, v2, vertex_groups)
-            mst_edges.append((weight, v1, v2))
-            connected_vertices.update([v1, v2])
+    Args:
+        num_vertices: Количество вершин (номера вершин меньше этого числа)
+        sources: Первые концы ребер
+        targets: Вторые концы ребер
+        weights: Веса ребер
 
-    # Второй проход - объединение разрозненных компонент
-    for weight, v1, v2 in sorted_edges:
-        if v2 not in vertex_groups.get(v1, []):
-            mst_edges.append((weight, v1, v2))
-            _merge_groups(v1, v2, vertex_groups)
+    Returns:
+        Индексы ребер, вошедших в минимальный остовный лес, в порядке добавления
+    """
+    # Ребра сортируются один раз
+    order = np.argsort(weights, kind='stable')
+    ordered_sources = np.asarray(sources)[order].tolist()
+    ordered_targets = np.asarray(targets)[order].tolist()
 
-    return mst_edges
+    components = DisjointSet(num_vertices)
+    selected = []
+    for position, (v1, v2) in enumerate(zip(ordered_sources, ordered_targets)):
+        if components.union(v1, v2):
+            selected.append(position)
+            if len(selected) == num_vertices - 1:
+                break
+
+    return order[selected]
+
+
+def find_minimum_spanning_tree(edges) -> np.ndarray:
+    """Находит минимальное остовное дерево алгоритмом Краскала, возвращает массив EDGE_DTYPE"""
+    edge_array = to_edge_array(edges)
+    if not len(edge_array):
+        return edge_array
+
+    v1, v2 = edge_array['v1'], edge_array['v2']
+    num_vertices = int(max(v1.max(), v2.max())) + 1
+
+    selected = kruskal(num_vertices, v1, v2, edge_array['weight'])
+    return edge_array[selected]
+
+
+def prim_heap(graph: CSRGraph) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Алгоритм Прима на двоичной куче с ленивым удалением, O(m log n)
+
+    Args:
+        graph: Неориентированный граф в формате CSR (каждое ребро в обе стороны)
+
+    Returns:
+        Кортеж массивов (первые концы, вторые концы, веса) ребер остовного леса
+    """
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    weights = graph.weights.tolist()
+    in_tree = [False] * graph.num_vertices
+    sources, targets, tree_weights = [], [], []
+
+    for start in range(graph.num_vertices):
+        if in_tree[start]:
+            continue
+
+        # Новая компонента связности - новое дерево леса
+        in_tree[start] = True
+        heap = [(weights[pos], start, indices[pos]) for pos in range(indptr[start], indptr[start + 1])]
+        heapq.heapify(heap)
+
+        while heap:
+            weight, parent, vertex = heapq.heappop(heap)
+            if in_tree[vertex]:
+                continue  # Устаревшая запись кучи
 
+            in_tree[vertex] = True
+            sources.append(parent)
+            targets.append(vertex)
+            tree_weights.append(weight)
 
-def find_minimum_spanning_tree_primm(edges: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
-    """Находит минимальное остовное дерево алгоритмом прима"""
-    if not edges:
-        return []
-
-    # Создаем словарь смежности для быстрого доступа к рёбрам из вершины
-    graph = {}
-    for u, v, weight in edges:
-        if u not in graph:
-            graph[u] = []
-        if v not in graph:
-            graph[v] = []
-        graph[u].append((v, weight))
-        graph[v].append((u, weight))
-
-    # Начинаем с первой вершины
-    start_vertex = edges[0][0]
-    connected_vertices = {start_vertex}
-    mst_edges = []
-
-    # Пока не подключили все вершины
-    while len(connected_vertices) < len(graph):
-        min_edge = None
-        min_weight = float('inf')
-
-        # Ищем минимальное ребро, соединяющее подключенные и неподключенные вершины
-        for vertex in connected_vertices:
-            for neighbor, weight in graph[vertex]:
-                if neighbor not in connected_vertices and weight < min_weight:
-                    min_weight = weight
-                    min_edge = (vertex, neighbor, weight)
-
-        if min_edge:
-            u, v, weight = min_edge
-            mst_edges.append(min_edge)
-            connected_vertices.add(v)
-        else:
-            break  # Граф несвязный
+            for pos in range(indptr[vertex], indptr[vertex + 1]):
+                neighbor = indices[pos]
+                if not in_tree[neighbor]:
+                    heapq.heappush(heap, (weights[pos], vertex, neighbor))
 
+    return (np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64),
+            np.array(tree_weights, dtype=np.int64))
+
+
+def prim_dense(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Алгоритм Прима за O(n^2) с векторным обновлением ключей по матрице весов
+
+    Args:
+        matrix: Симметричная матрица весов, 0 - отсутствие ребра
+
+    Returns:
+        Кортеж массивов (первые концы, вторые концы, веса) ребер остовного леса
+    """
+    size = len(matrix)
+    costs = np.where(np.asarray(matrix) != 0, matrix, np.inf).astype(float)
+    np.fill_diagonal(costs, np.inf)
+
+    in_tree = np.zeros(size, dtype=bool)
+    keys = np.full(size, np.inf)
+    parents = np.full(size, -1, dtype=np.int64)
+    sources, targets = [], []
+
+    for _ in range(size):
+        candidates = np.where(in_tree, np.inf, keys)
+        vertex = int(np.argmin(candidates))
+        if np.isinf(candidates[vertex]):
+            # Оставшиеся вершины недостижимы - начинаем новое дерево
+            vertex = int(np.argmin(in_tree))
+        elif parents[vertex] >= 0:
+            sources.append(int(parents[vertex]))
+            targets.append(vertex)
+
+        in_tree[vertex] = True
+        improved = ~in_tree & (costs[vertex] < keys)
+        keys[improved] = costs[vertex][improved]
+        parents[improved] = vertex
+
+    sources = np.array(sources, dtype=np.int64)
+    targets = np.array(targets, dtype=np.int64)
+    return sources, targets, np.asarray(matrix)[sources, targets].astype(np.int64)
+
+
+def find_minimum_spanning_tree_primm(edges, method: str = 'auto') -> np.ndarray:
+    """
+    Находит минимальное остовное дерево алгоритмом Прима
+
+    Args:
+        edges: Ребра (вес, вершина1, вершина2) - список или массив EDGE_DTYPE
+        method: 'heap' - куча по CSR, 'dense' - O(n^2) по матрице весов,
+            'auto' - выбор по плотности графа
+
+    Returns:
+        Ребра дерева - массив EDGE_DTYPE
+    """
+    edge_array = to_edge_array(edges)
+    if not len(edge_array):
+        return edge_array
+
+    weights, v1, v2 = edge_array['weight'], edge_array['v1'] - 1, edge_array['v2'] - 1
+    size = int(max(v1.max(), v2.max())) + 1
+
+    if method == 'auto':
+        density = 2 * len(edges) / max(1, size * (size - 1))
+        method = 'dense' if density >= DENSE_GRAPH_THRESHOLD else 'heap'
+
+    if method == 'dense':
+        # При кратных ребрах в матрицу попадает самое легкое
+        no_edge = np.iinfo(np.int64).max
+        matrix = np.full((size, size), no_edge, dtype=np.int64)
+        rows, cols = np.concatenate([v1, v2]), np.concatenate([v2, v1])
+        np.minimum.at(matrix, (rows, cols), np.concatenate([weights, weights]))
+        matrix[matrix == no_edge] = 0
+        sources, targets, tree_weights = prim_dense(matrix)
+    elif method == 'heap':
+        graph = CSRGraph.from_edges(size, np.concatenate([v1, v2]), np.concatenate([v2, v1]),
+                                    np.concatenate([weights, weights]))
+        sources, targets, tree_weights = prim_heap(graph)
+    else:
+        raise ValueError(f"Неизвестный вариант алгоритма Прима: {method}")
+
+    mst_edges = np.empty(len(tree_weights), dtype=EDGE_DTYPE)
+    mst_edges['weight'] = tree_weights
+    mst_edges['v1'] = np.minimum(sources, targets) + 1
+    mst_edges['v2'] = np.maximum(sources, targets) + 1
     return mst_edges
 
 
+def find_minimum_spanning_tree_boruvka(edges, workers: int = 1) -> np.ndarray:
+    """Находит минимальное остовное дерево алгоритмом Борувки, возвращает массив EDGE_DTYPE"""
+    edge_array = to_edge_array(edges)
+    if not len(edge_array):
+        return edge_array
+
+    v1, v2 = edge_array['v1'], edge_array['v2']
+    num_vertices = int(max(v1.max(), v2.max())) + 1
+
+    selected = boruvka(num_vertices, v1, v2, edge_array['weight'], workers)
+    return edge_array[selected]
+
+
 def pick_file_from_matrix_mass():
     print("Выберите файл, который вы хотели бы использовать для тестирования программы (стандартный - g22.txt):\n")
     all_files = list(os.listdir('Matrix_Mass'))
@@ -0,0 +1,327 @@
+import mmap
+import os
+import time
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# Ограничение на размер временного блока (ti x tk x tj) при умножении
+TILE_ELEMENTS = 1 << 22
+INNER_TILE = 32
+COLUMN_TILE = 2048
+# Меньше этого числа элементов результата пул процессов не используется
+MIN_PARALLEL_ELEMENTS = 1 << 16
+
+
+class Semiring(NamedTuple):
+    """
+    Полукольцо для умножения матриц: C[i][j] = add по k от multiply(A[i][k], B[k][j]).
+
+    Attributes:
+        add: Универсальная функция NumPy для "сложения" (выбора пути)
+        multiply: Универсальная функция NumPy для "умножения" (продления пути)
+        zero: Нейтральный элемент сложения (пути нет)
+        dtype: Тип элементов матриц
+    """
+    add: np.ufunc
+    multiply: np.ufunc
+    zero: object
+    dtype: type
+
+
+SEMIRINGS: Dict[str, Semiring] = {
+    'min-plus': Semiring(np.minimum, np.add, np.inf, np.float64),
+    'max-plus': Semiring(np.maximum, np.add, -np.inf, np.float64),
+    'boolean': Semiring(np.logical_or, np.logical_and, False, np.bool_),
+}
+
+
+def register_semiring(name: str, semiring: Semiring) -> None:
+    """
+    Добавляет полукольцо, доступное по имени в semiring_product.
+
+    Функции полукольца должны импортироваться в дочерних процессах,
+    поэтому регистрировать его нужно на уровне модуля.
+    """
+    SEMIRINGS[name] = semiring
+
+
+def get_semiring(name: str) -> Semiring:
+    """Возвращает полукольцо по имени."""
+    if name not in SEMIRINGS:
+        raise ValueError(f"Неизвестное полукольцо: {name}. Допустимые: {list(SEMIRINGS)}")
+    return SEMIRINGS[name]
+
+
+def _product_rows(matrix_a: np.ndarray, matrix_b: np.ndarray, semiring: Semiring,
+                  out: np.ndarray, row_start: int, row_stop: int) -> None:
+    """Вычисляет строки [row_start, row_stop) произведения плитками (ti x tj)."""
+    inner = matrix_a.shape[1]
+    cols = matrix_b.shape[1]
+    add, multiply = semiring.add, semiring.multiply
+
+    inner_tile = max(1, min(inner, INNER_TILE))
+    col_tile = max(1, min(cols, COLUMN_TILE))
+    row_tile = max(1, TILE_ELEMENTS // (inner_tile * col_tile))
+
+    for tile_start in range(row_start, row_stop, row_tile):
+        tile_stop = min(tile_start + row_tile, row_stop)
+        for col_start in range(0, cols, col_tile):
+            col_stop = min(col_start + col_tile, cols)
+            tile = np.full((tile_stop - tile_start, col_stop - col_start), semiring.zero, dtype=semiring.dtype)
+            for k_start in range(0, inner, inner_tile):
+                k_stop = k_start + inner_tile
+                block_a = np.asarray(matrix_a[tile_start:tile_stop, k_start:k_stop])
+                block_b = np.asarray(matrix_b[k_start:k_stop, col_start:col_stop])
+                candidates = multiply(block_a[:, :, None], block_b[None, :, :])
+                add(tile, add.reduce(candidates, axis=1), out=tile)
+            out[tile_start:tile_stop, col_start:col_stop] = tile
+
+
+class SharedArena:
+    """
+    Массивы в разделяемой памяти, которые передаются пулу процессов без копирования.
+
+    Владелец (например, ShimbellEngine) выделяет в арене свои матрицы один
+    раз; semiring_product передает их дочерним процессам по имени блока,
+    а результат, размещенный в арене, процессы заполняют напрямую.
+    """
+
+    def __init__(self):
+        # id массива -> (описание для _attach, блок, массив)
+        self._arrays: Dict[int, Tuple[tuple, shared_memory.SharedMemory, np.ndarray]] = {}
+
+    def empty(self, shape: Tuple[int, ...], dtype=np.float64) -> np.ndarray:
+        """Создает неинициализированный массив в новом блоке разделяемой памяти."""
+        dtype = np.dtype(dtype)
+        block = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        self._arrays[id(array)] = (('shm', block.name, 0, tuple(shape), dtype.str), block, array)
+        return array
+
+    def descriptor(self, array: np.ndarray) -> Optional[tuple]:
+        """Возвращает описание массива арены или None, если массив не из арены."""
+        entry = self._arrays.get(id(array))
+        return entry[0] if entry is not None and entry[2] is array else None
+
+    def release(self, array: np.ndarray) -> None:
+        """Освобождает блок массива; память возвращается, когда исчезнут все ссылки на массив."""
+        entry = self._arrays.pop(id(array), None)
+        if entry is None or entry[2] is not array:
+            return
+        _, block, _ = entry
+        block.unlink()
+        try:
+            block.close()
+        except BufferError:
+            # На массив еще ссылаются снаружи: отображение закроется вместе с ним
+            pass
+
+    def close(self) -> None:
+        """Освобождает все блоки арены."""
+        for _, _, array in list(self._arrays.values()):
+            self.release(array)
+
+
+def _share(array: np.ndarray, arena: Optional[SharedArena] = None) -> Tuple[tuple, Optional[shared_memory.SharedMemory]]:
+    """
+    Готовит массив к передаче в дочерние процессы без сериализации данных.
+
+    np.memmap передается именем файла (процессы отображают его сами),
+    массивы из arena - именем их блока, остальные массивы копируются
+    в новый блок разделяемой памяти.
+
+    Returns:
+        Кортеж (описание массива, новый блок разделяемой памяти или None)
+    """
+    if isinstance(array, np.memmap) and isinstance(array.base, mmap.mmap):
+        array.flush()
+        return ('file', array.filename, array.offset, array.shape, array.dtype.str), None
+
+    descriptor = arena.descriptor(array) if arena is not None else None
+    if descriptor is not None:
+        return descriptor, None
+
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    return ('shm', block.name, 0, array.shape, array.dtype.str), block
+
+
+def _attach(descriptor: tuple, writable: bool = False) -> Tuple[np.ndarray, Optional[shared_memory.SharedMemory]]:
+    """Открывает в дочернем процессе массив, описанный функцией _share."""
+    kind, name, offset, shape, dtype = descriptor
+    if kind == 'file':
+        mode = 'r+' if writable else 'r'
+        return np.memmap(name, dtype=dtype, mode=mode, offset=offset, shape=shape), None
+
+    block = shared_memory.SharedMemory(name=name)
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf), block
+
+
+def _product_worker(a_descriptor: tuple, b_descriptor: tuple, out_descriptor: tuple,
+                    semiring_name: str, row_start: int, row_stop: int) -> None:
+    """Вычисляет блок строк произведения в дочернем процессе."""
+    blocks = []
+    try:
+        matrix_a, block = _attach(a_descriptor)
+        blocks.append(block)
+        matrix_b, block = _attach(b_descriptor)
+        blocks.append(block)
+        out, block = _attach(out_descriptor, writable=True)
+        blocks.append(block)
+
+        _product_rows(matrix_a, matrix_b, get_semiring(semiring_name), out, row_start, row_stop)
+        if isinstance(out, np.memmap):
+            out.flush()
+        del matrix_a, matrix_b, out
+    finally:
+        for block in blocks:
+            if block is not None:
+                block.close()
+
+
+def semiring_product(matrix_a: np.ndarray, matrix_b: np.ndarray, semiring: str = 'min-plus',
+                     out: Optional[np.ndarray] = None, workers: int = 1,
+                     executor: Optional[ProcessPoolExecutor] = None,
+                     arena: Optional[SharedArena] = None) -> np.ndarray:
+    """
+    Произведение матриц в заданном полукольце.
+
+    Результат делится на блоки строк, которые считаются в пуле процессов.
+    Входы и результат передаются через разделяемую память (или как файлы,
+    если это np.memmap), поэтому матрицы не копируются при сериализации.
+    Внутри блока умножение идет плитками, как в tropical_product.
+
+    Args:
+        matrix_a: Первая матрица (rows x inner)
+        matrix_b: Вторая матрица (inner x cols)
+        semiring: Имя полукольца из SEMIRINGS
+        out: Массив (rows x cols) для результата, например np.memmap
+        workers: Количество процессов (1 - вычисление в текущем процессе)
+        executor: Готовый пул процессов, чтобы не создавать его при каждом вызове
+        arena: Арена, массивы которой передаются процессам без копирования
+
+    Returns:
+        Результирующая матрица
+    """
+    ring = get_semiring(semiring)
+    rows, inner = matrix_a.shape
+    if matrix_b.shape[0] != inner:
+        raise ValueError(f"Несовместимые размеры матриц: {matrix_a.shape} и {matrix_b.shape}")
+    cols = matrix_b.shape[1]
+
+    if out is None:
+        out = np.empty((rows, cols), dtype=ring.dtype)
+
+    if workers > 1 and executor is None and rows > 1 and rows * cols >= MIN_PARALLEL_ELEMENTS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return semiring_product(matrix_a, matrix_b, semiring, out, workers, pool, arena)
+
+    if executor is None or workers <= 1 or rows < 2 or rows * cols < MIN_PARALLEL_ELEMENTS:
+        _product_rows(matrix_a, matrix_b, ring, out, 0, rows)
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
+    blocks: List[Optional[shared_memory.SharedMemory]] = []
+    try:
+        a_descriptor, block = _share(matrix_a, arena)
+        blocks.append(block)
+        b_descriptor, block = _share(matrix_b, arena)
+        blocks.append(block)
+        if isinstance(out, np.memmap) or (arena is not None and arena.descriptor(out) is not None):
+            out_descriptor, block = _share(out, arena)
+        else:
+            out_descriptor, block = _share(np.empty((rows, cols), dtype=out.dtype))
+        blocks.append(block)
+
+        bounds = np.linspace(0, rows, min(workers, rows) + 1).astype(int)
+        futures = [
+            executor.submit(_product_worker, a_descriptor, b_descriptor, out_descriptor,
+                            semiring, int(start), int(stop))
+            for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start
+        ]
+        for future in futures:
+            future.result()
+
+        if block is not None:
+            out[:] = np.ndarray((rows, cols), dtype=out.dtype, buffer=block.buf)
+    finally:
+        for block in blocks:
+            if block is not None:
+                block.close()
+                block.unlink()
+
+    return out
+
+
+def transitive_closure(adjacency, workers: int = 1) -> np.ndarray:
+    """
+    Рефлексивно-транзитивное замыкание повторным возведением в квадрат
+    в булевом полукольце: после ceil(log2 n) шагов R[i][j] - достижима ли j из i.
+
+    Args:
+        adjacency: Матрица смежности (ненулевой элемент - есть ребро)
+        workers: Количество процессов для умножения
+
+    Returns:
+        Булева матрица достижимости n x n
+    """
+    reach = np.asarray(adjacency) != 0
+    np.fill_diagonal(reach, True)
+
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as pool:
+        while True:
+            squared = semiring_product(reach, reach, 'boolean', workers=workers, executor=pool)
+            if np.array_equal(squared, reach):
+                return reach
+            reach = squared
+
+
+def benchmark(size: int = 512, workers: Optional[int] = None, semiring: str = 'min-plus',
+              repeats: int = 3) -> Dict[str, float]:
+    """
+    Замеряет ускорение параллельного умножения на случайной матрице.
+
+    Args:
+        size: Размер матрицы
+        workers: Количество процессов (по умолчанию - число ядер)
+        semiring: Имя полукольца
+        repeats: Количество повторов, берется лучшее время
+
+    Returns:
+        Словарь с временем последовательного и параллельного умножения и ускорением
+    """
+    workers = workers or os.cpu_count() or 1
+    rng = np.random.default_rng(0)
+    if get_semiring(semiring).dtype == np.bool_:
+        matrix = rng.random((size, size)) < 0.01
+    else:
+        matrix = rng.integers(1, 100, (size, size)).astype(np.float64)
+
+    def best_time(run_workers: int, pool: Optional[ProcessPoolExecutor]) -> float:
+        times = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            semiring_product(matrix, matrix, semiring, workers=run_workers, executor=pool)
+            times.append(time.perf_counter() - started)
+        return min(times)
+
+    serial = best_time(1, None)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Прогрев: запуск процессов не входит в замер
+        semiring_product(matrix, matrix, semiring, workers=workers, executor=pool)
+        parallel = best_time(workers, pool)
+
+    return {'workers': workers, 'serial': serial, 'parallel': parallel, 'speedup': serial / parallel}
+
+
+if __name__ == "__main__":
+    for name in ('min-plus', 'boolean'):
+        result = benchmark(semiring=name)
+        print(f"{name}: процессов {result['workers']}, последовательно {result['serial']:.3f} с, "
+              f"параллельно {result['parallel']:.3f} с, ускорение {result['speedup']:.2f}")
@@ -0,0 +1,418 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from Semiring import TILE_ELEMENTS, INNER_TILE, COLUMN_TILE, SharedArena, semiring_product
+
+# Количество строк, переводимых в представление с бесконечностью за раз
+CONVERT_ROWS = 1024
+
+# Операция выбора пути и значение "пути нет" для каждого режима
+MODES = {
+    'min': (np.minimum, np.inf),
+    'max': (np.maximum, -np.inf),
+}
+# Полукольцо из Semiring для каждого режима
+MODE_SEMIRINGS = {
+    'min': 'min-plus',
+    'max': 'max-plus',
+}
+# Выбор номера лучшей промежуточной вершины и сравнение "строго лучше"
+WITNESS_OPERATIONS = {
+    'min': (np.argmin, np.less),
+    'max': (np.argmax, np.greater),
+}
+NO_WITNESS = -1
+
+
+def load_matrix(filename: str) -> np.ndarray:
+    """
+    Читает матрицу весов из текстового файла или двоичного .npy (отображается в память).
+
+    Args:
+        filename: Путь к файлу с матрицей (0 - ребра нет)
+
+    Returns:
+        Квадратная матрица весов
+
+    Raises:
+        ValueError: если матрица не квадратная
+    """
+    if filename.endswith('.npy'):
+        matrix = np.load(filename, mmap_mode='r')
+    else:
+        matrix = np.loadtxt(filename, dtype=np.int64, ndmin=2)
+
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError(f"Матрица смежности должна быть квадратной, получено {matrix.shape}")
+    return matrix
+
+
+def _check_mode(mode: str) -> None:
+    """Проверяет режим поиска путей."""
+    if mode not in MODES:
+        raise ValueError(f"Неизвестный режим: {mode}. Допустимые режимы: {list(MODES)}")
+
+
+def to_sentinel(matrix, mode: str, out: Optional[np.ndarray] = None,
+                zero_diagonal: bool = False) -> np.ndarray:
+    """
+    Переводит матрицу, где 0 означает отсутствие ребра, в матрицу с бесконечностью.
+
+    Перевод идет блоками строк, поэтому матрица и результат могут быть
+    отображенными в память файлами больше оперативной памяти.
+
+    Args:
+        matrix: Матрица весов (0 - ребра нет)
+        mode: 'min' (отсутствие - +inf) или 'max' (отсутствие - -inf)
+        out: Массив для результата (по умолчанию создается в памяти)
+        zero_diagonal: Считать ли диагональ отсутствующими ребрами
+
+    Returns:
+        Матрица float64 с бесконечностями вместо отсутствующих ребер
+    """
+    _check_mode(mode)
+    if not isinstance(matrix, np.ndarray):
+        matrix = np.asarray(matrix)
+    if out is None:
+        out = np.empty(matrix.shape, dtype=np.float64)
+
+    empty = MODES[mode][1]
+    for start in range(0, matrix.shape[0], CONVERT_ROWS):
+        block = np.asarray(matrix[start:start + CONVERT_ROWS], dtype=np.float64)
+        block[block == 0] = empty
+        if zero_diagonal:
+            rows = np.arange(len(block))
+            diagonal = rows + start < block.shape[1]
+            block[rows[diagonal], rows[diagonal] + start] = empty
+        out[start:start + CONVERT_ROWS] = block
+
+    return out
+
+
+def from_sentinel(matrix: np.ndarray) -> List[List[int]]:
+    """Переводит матрицу с бесконечностями обратно в целочисленную, где 0 - пути нет."""
+    return np.where(np.isfinite(matrix), matrix, 0).astype(np.int64).tolist()
+
+
+def tropical_product(matrix_a: np.ndarray, matrix_b: np.ndarray, mode: str = 'min',
+                     out: Optional[np.ndarray] = None, witness: Optional[np.ndarray] = None,
+                     workers: int = 1, executor: Optional[ProcessPoolExecutor] = None,
+                     arena: Optional[SharedArena] = None) -> np.ndarray:
+    """
+    Произведение матриц в полукольце (min, +) или (max, +).
+
+    C[i][j] = min/max по k от A[i][k] + B[k][j]. Матрицы могут быть
+    прямоугольными. Результат считается плитками (ti x tj), для каждой
+    плитки в память загружаются только блоки A[ti x tk] и B[tk x tj],
+    а временный массив (ti x tk x tj) не превышает TILE_ELEMENTS элементов.
+    Поэтому входы и out могут быть np.memmap больше оперативной памяти.
+
+    Args:
+        matrix_a: Первая матрица (rows x inner) с бесконечностью вместо отсутствующих ребер
+        matrix_b: Вторая матрица (inner x cols) в том же представлении
+        mode: 'min' или 'max'
+        out: Массив (rows x cols) для результата, например np.memmap
+        witness: Массив int32 (rows x cols), в который записывается k,
+            на котором достигается экстремум (NO_WITNESS, если пути нет)
+        workers: Количество процессов (без witness умножение идет через semiring_product)
+        executor: Готовый пул процессов для semiring_product
+        arena: Арена разделяемой памяти для semiring_product
+
+    Returns:
+        Результирующая матрица
+    """
+    _check_mode(mode)
+    if witness is None:
+        return semiring_product(matrix_a, matrix_b, MODE_SEMIRINGS[mode], out=out, workers=workers,
+                                executor=executor, arena=arena)
+
+    empty = MODES[mode][1]
+    rows, inner = matrix_a.shape
+    if matrix_b.shape[0] != inner:
+        raise ValueError(f"Несовместимые размеры матриц: {matrix_a.shape} и {matrix_b.shape}")
+    cols = matrix_b.shape[1]
+
+    if out is None:
+        out = np.empty((rows, cols), dtype=np.float64)
+
+    inner_tile = max(1, min(inner, INNER_TILE))
+    col_tile = max(1, min(cols, COLUMN_TILE))
+    row_tile = max(1, TILE_ELEMENTS // (inner_tile * col_tile))
+
+    for row_start in range(0, rows, row_tile):
+        row_stop = min(row_start + row_tile, rows)
+        for col_start in range(0, cols, col_tile):
+            col_stop = min(col_start + col_tile, cols)
+            tile = np.full((row_stop - row_start, col_stop - col_start), empty)
+            tile_witness = np.full(tile.shape, NO_WITNESS, dtype=np.int32)
+            for k_start in range(0, inner, inner_tile):
+                k_stop = k_start + inner_tile
+                block_a = np.asarray(matrix_a[row_start:row_stop, k_start:k_stop])
+                block_b = np.asarray(matrix_b[k_start:k_stop, col_start:col_stop])
+                candidates = block_a[:, :, None] + block_b[None, :, :]
+                select, better = WITNESS_OPERATIONS[mode]
+                best_k = select(candidates, axis=1)
+                best = np.take_along_axis(candidates, best_k[:, None, :], axis=1)[:, 0, :]
+                improved = better(best, tile)
+                tile[improved] = best[improved]
+                tile_witness[improved] = best_k[improved] + k_start
+            out[row_start:row_stop, col_start:col_stop] = tile
+            witness[row_start:row_stop, col_start:col_stop] = tile_witness
+
+    for array in (out, witness):
+        if isinstance(array, np.memmap):
+            array.flush()
+    return out
+
+
+class ShimbellEngine:
+    """
+    Вычисление экстремальных путей фиксированной длины методом Шимбелла.
+
+    Размер графа определяется по входным данным. Базовая матрица читается
+    из файла один раз и хранится в NumPy с бесконечностью вместо
+    отсутствующих ребер. Если задан storage_dir, базовые матрицы и все
+    степени хранятся в файлах .npy через np.memmap, а умножение идет
+    плитками с диска - так обрабатываются графы больше оперативной памяти.
+
+    При workers > 1 движок на все время жизни создает один пул процессов,
+    а матрицы в памяти размещает в разделяемой памяти (SharedArena), поэтому
+    умножения не запускают процессы и не копируют операнды заново.
+    Ресурсы освобождает close() (или выход из блока with).
+
+    Attributes:
+        base: Исходная матрица весов (0 - ребра нет)
+        size: Количество вершин
+    """
+
+    def __init__(self, filename: Optional[str] = None, matrix=None, storage_dir: Optional[str] = None,
+                 workers: int = 1):
+        """
+        Args:
+            filename: Текстовый файл с матрицей или двоичный .npy (отображается в память)
+            matrix: Матрица весов вместо файла
+            storage_dir: Каталог для хранения матриц на диске
+            workers: Количество процессов для умножения матриц
+        """
+        if matrix is None:
+            if filename is None:
+                raise ValueError("Нужно указать файл или матрицу")
+            matrix = load_matrix(filename)
+
+        if not isinstance(matrix, np.ndarray):
+            matrix = np.array(matrix, dtype=np.int64)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError(f"Матрица смежности должна быть квадратной, получено {matrix.shape}")
+
+        self.base = matrix
+        self.size = matrix.shape[0]
+        self.storage_dir = storage_dir
+        self.workers = workers
+        if storage_dir:
+            os.makedirs(storage_dir, exist_ok=True)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Файлы storage_dir процессы отображают сами, арена нужна только для матриц в памяти
+        self._arena = SharedArena() if workers > 1 and not storage_dir else None
+
+        # Диагональ обнуляется: петли не учитываются
+        self._sentinel_base = {
+            mode: to_sentinel(matrix, mode, self._allocate(f'base_{mode}'), zero_diagonal=True)
+            for mode in MODES
+        }
+        # Уже вычисленные степени: режим -> {длина пути: матрица}
+        self._powers = {mode: {1: self._sentinel_base[mode]} for mode in MODES}
+        # Матрицы свидетелей (L, n, n) для восстановления путей
+        self._witnesses = {}
+
+    def _allocate(self, name: str) -> np.ndarray:
+        """Создает матрицу size x size в памяти или в файле storage_dir/name.npy."""
+        shape = (self.size, self.size)
+        if self._arena is not None:
+            return self._arena.empty(shape, dtype=np.float64)
+        if not self.storage_dir:
+            return np.empty(shape, dtype=np.float64)
+        path = os.path.join(self.storage_dir, f'{name}.npy')
+        return np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=shape)
+
+    def _pool(self) -> Optional[ProcessPoolExecutor]:
+        """Возвращает пул процессов движка, создавая его при первом умножении."""
+        if self.workers > 1 and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Останавливает пул процессов и освобождает разделяемую память."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._arena is not None:
+            self._arena.close()
+
+    def __enter__(self) -> 'ShimbellEngine':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _product(self, matrix_a: np.ndarray, matrix_b: np.ndarray, mode: str, name: str) -> np.ndarray:
+        """Умножает матрицы, размещая результат в памяти или на диске."""
+        return tropical_product(matrix_a, matrix_b, mode, out=self._allocate(name), workers=self.workers,
+                                executor=self._pool(), arena=self._arena)
+
+    def base_matrix(self, mode: str) -> np.ndarray:
+        """Возвращает базовую матрицу с бесконечностями для режима."""
+        _check_mode(mode)
+        return self._sentinel_base[mode]
+
+    def step(self, matrix: np.ndarray, mode: str) -> np.ndarray:
+        """Удлиняет пути на одно ребро: matrix (x) base."""
+        return tropical_product(matrix, self._sentinel_base[mode], mode, workers=self.workers,
+                                executor=self._pool(), arena=self._arena)
+
+    def _square_power(self, mode: str, bit: int) -> np.ndarray:
+        """Возвращает base^(2^bit), вычисляя недостающие квадраты."""
+        powers = self._powers[mode]
+        exponent = 1 << bit
+        if exponent not in powers:
+            half = self._square_power(mode, bit - 1)
+            powers[exponent] = self._product(half, half, mode, f'{mode}_pow{exponent}')
+        return powers[exponent]
+
+    def power(self, length: int, mode: str) -> np.ndarray:
+        """
+        Вычисляет base^length в полукольце бинарным возведением в степень.
+
+        Требуется O(log L) умножений. Все промежуточные степени сохраняются,
+        следующий запрос начинается с наибольшей уже известной степени,
+        не превосходящей length.
+
+        Args:
+            length: Количество ребер в пути (не меньше 1)
+            mode: 'min' или 'max'
+
+        Returns:
+            Матрица весов путей с бесконечностью там, где пути нет
+        """
+        _check_mode(mode)
+        if length < 1:
+            raise ValueError("Длина пути должна быть положительным числом")
+
+        powers = self._powers[mode]
+        if length in powers:
+            return powers[length]
+
+        start = max(exponent for exponent in powers if exponent <= length)
+        result = powers[start]
+        exponent = start
+        remaining = length - start
+        bit = 0
+        while remaining:
+            if remaining & 1:
+                exponent += 1 << bit
+                factor = self._square_power(mode, bit)
+                result = self._product(result, factor, mode, f'{mode}_pow{exponent}')
+                powers[exponent] = result
+            remaining >>= 1
+            bit += 1
+
+        return result
+
+    def paths(self, length: int, mode: str) -> np.ndarray:
+        """
+        Вычисляет матрицу экстремальных путей заданной длины.
+
+        Args:
+            length: Количество ребер в пути (не меньше 1)
+            mode: 'min' или 'max'
+
+        Returns:
+            Матрица весов путей с бесконечностью там, где пути нет
+        """
+        return self.power(length, mode)
+
+    def clear_cache(self) -> None:
+        """Освобождает память, занятую сохраненными степенями."""
+        if self._arena is not None:
+            for mode, powers in self._powers.items():
+                for length, matrix in powers.items():
+                    if length != 1:
+                        self._arena.release(matrix)
+        self._powers = {mode: {1: self._sentinel_base[mode]} for mode in MODES}
+
+    def iter_all_lengths(self, max_length: int, mode: str,
+                         witness_file: Optional[str] = None) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Последовательно вычисляет матрицы путей длины 1..max_length.
+
+        Для каждой длины L сохраняется матрица свидетелей W[L][i][j] -
+        предпоследняя вершина оптимального пути (int32, NO_WITNESS если пути нет),
+        по которой reconstruct_path восстанавливает путь без пересчета.
+
+        Args:
+            max_length: Наибольшая длина пути
+            mode: 'min' или 'max'
+            witness_file: Файл .npy для хранения свидетелей на диске
+
+        Yields:
+            Пары (длина пути, матрица весов путей)
+        """
+        _check_mode(mode)
+        if max_length < 1:
+            raise ValueError("Длина пути должна быть положительным числом")
+
+        shape = (max_length, self.size, self.size)
+        if witness_file:
+            witnesses = np.lib.format.open_memmap(witness_file, mode='w+', dtype=np.int32, shape=shape)
+        else:
+            witnesses = np.empty(shape, dtype=np.int32)
+        self._witnesses[mode] = witnesses
+
+        # Путь длины 1 - само ребро, предпоследняя вершина - его начало
+        matrix = self._sentinel_base[mode]
+        rows = np.arange(self.size, dtype=np.int32)
+        for start in range(0, self.size, CONVERT_ROWS):
+            block = np.asarray(matrix[start:start + CONVERT_ROWS])
+            witnesses[0, start:start + CONVERT_ROWS] = np.where(
+                np.isfinite(block), rows[start:start + CONVERT_ROWS, None], NO_WITNESS
+            )
+        yield 1, matrix
+
+        for length in range(2, max_length + 1):
+            matrix = tropical_product(matrix, self._sentinel_base[mode], mode,
+                                      out=self._allocate(f'{mode}_pow{length}'), witness=witnesses[length - 1])
+            self._powers[mode].setdefault(length, matrix)
+            yield length, matrix
+
+    def reconstruct_path(self, source: int, target: int, length: int, mode: str) -> Optional[List[int]]:
+        """
+        Восстанавливает путь по сохраненным свидетелям (нумерация вершин с 0).
+
+        Args:
+            source: Начальная вершина
+            target: Конечная вершина
+            length: Длина пути (не больше max_length из iter_all_lengths)
+            mode: 'min' или 'max'
+
+        Returns:
+            Список из length + 1 вершин или None, если пути нет
+
+        Raises:
+            ValueError: если свидетели для этой длины не вычислены
+        """
+        witnesses = self._witnesses.get(mode)
+        if witnesses is None or not 1 <= length <= len(witnesses):
+            raise ValueError(f"Свидетели для путей длины {length} не вычислены, вызовите iter_all_lengths")
+
+        path = [target]
+        vertex = target
+        for current_length in range(length, 0, -1):
+            vertex = int(witnesses[current_length - 1, source, vertex])
+            if vertex == NO_WITNESS:
+                return None
+            path.append(vertex)
+
+        path.reverse()
+        return path
@@ -0,0 +1,208 @@
+import heapq
+import sys
+import time
+from typing import Dict, Tuple
+
+import numpy as np
+
+from Shimbell import load_matrix, tropical_product, to_sentinel
+from main import MATRIX_FILE
+
+
+def to_csr(matrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Переводит матрицу весов в формат CSR (петли не учитываются).
+
+    Returns:
+        Кортеж (indptr, indices, weights)
+    """
+    matrix = np.asarray(matrix)
+    mask = matrix != 0
+    np.fill_diagonal(mask, False)
+    rows, cols = np.nonzero(mask)
+    indptr = np.zeros(matrix.shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=matrix.shape[0]), out=indptr[1:])
+    return indptr, cols.astype(np.int64), matrix[rows, cols].astype(np.float64)
+
+
+def dijkstra(matrix, source: int) -> np.ndarray:
+    """
+    Кратчайшие расстояния от вершины алгоритмом Дейкстры (двоичная куча, CSR).
+
+    Args:
+        matrix: Матрица весов (0 - ребра нет) с неотрицательными весами
+        source: Начальная вершина (нумерация с 0)
+
+    Returns:
+        Массив расстояний, np.inf для недостижимых вершин
+
+    Raises:
+        ValueError: если в графе есть отрицательные веса
+    """
+    indptr, indices, weights = to_csr(matrix)
+    if len(weights) and weights.min() < 0:
+        raise ValueError("Алгоритм Дейкстры не работает с отрицательными весами")
+    indptr, indices, weights = indptr.tolist(), indices.tolist(), weights.tolist()
+
+    distances = [float('inf')] * (len(indptr) - 1)
+    distances[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        distance, vertex = heapq.heappop(heap)
+        if distance > distances[vertex]:
+            continue
+        for position in range(indptr[vertex], indptr[vertex + 1]):
+            neighbor = indices[position]
+            candidate = distance + weights[position]
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                heapq.heappush(heap, (candidate, neighbor))
+
+    return np.array(distances)
+
+
+def bellman_ford(matrix, source: int) -> np.ndarray:
+    """
+    Кратчайшие расстояния от вершины алгоритмом Беллмана-Форда.
+
+    Каждый раунд - векторная релаксация всех ребер через np.minimum.at;
+    если ничего не изменилось, работа завершается досрочно.
+
+    Args:
+        matrix: Матрица весов (0 - ребра нет), веса могут быть отрицательными
+        source: Начальная вершина (нумерация с 0)
+
+    Returns:
+        Массив расстояний, np.inf для недостижимых вершин
+
+    Raises:
+        ValueError: если из source достижим цикл отрицательного веса
+    """
+    indptr, targets, weights = to_csr(matrix)
+    num_vertices = len(indptr) - 1
+    sources = np.repeat(np.arange(num_vertices), np.diff(indptr))
+
+    distances = np.full(num_vertices, np.inf)
+    distances[source] = 0.0
+    for _ in range(num_vertices):
+        relaxed = distances.copy()
+        np.minimum.at(relaxed, targets, distances[sources] + weights)
+        if np.array_equal(relaxed, distances):
+            return distances
+        distances = relaxed
+
+    # Изменения на n-м раунде возможны только из-за отрицательного цикла
+    raise ValueError("В графе есть цикл отрицательного веса")
+
+
+def floyd_warshall(matrix) -> np.ndarray:
+    """
+    Кратчайшие расстояния между всеми парами вершин алгоритмом Флойда-Уоршелла.
+
+    Для каждой промежуточной вершины k вся матрица обновляется одной
+    векторной операцией: D = min(D, D[:, k] + D[k, :]).
+
+    Args:
+        matrix: Матрица весов (0 - ребра нет)
+
+    Returns:
+        Матрица расстояний с np.inf там, где пути нет
+
+    Raises:
+        ValueError: если в графе есть цикл отрицательного веса
+    """
+    distances = to_sentinel(matrix, 'min', zero_diagonal=True)
+    np.fill_diagonal(distances, 0.0)
+
+    for k in range(len(distances)):
+        np.minimum(distances, distances[:, k, None] + distances[None, k, :], out=distances)
+
+    if (np.diagonal(distances) < 0).any():
+        raise ValueError("В графе есть цикл отрицательного веса")
+    return distances
+
+
+def shimbell_shortest_paths(matrix, squaring: bool = True) -> np.ndarray:
+    """
+    Кратчайшие пути любой длины методом Шимбелла, для сравнения с другими алгоритмами.
+
+    К матрице добавляется нулевая диагональ (пути длины не больше L),
+    затем она умножается до сходимости: по одному ребру (до n - 1 умножений, O(n^4))
+    или возведением в квадрат (O(n^3 log n)).
+
+    Args:
+        matrix: Матрица весов (0 - ребра нет), без циклов отрицательного веса
+        squaring: Возводить ли матрицу в квадрат вместо умножения на исходную
+
+    Returns:
+        Матрица расстояний с np.inf там, где пути нет
+    """
+    base = to_sentinel(matrix, 'min', zero_diagonal=True)
+    np.fill_diagonal(base, 0.0)
+
+    result = base
+    for _ in range(max(1, len(base) - 1)):
+        following = tropical_product(result, result if squaring else base, 'min')
+        if np.array_equal(following, result):
+            break
+        result = following
+    return result
+
+
+def benchmark(matrix, repeats: int = 3) -> Dict[str, float]:
+    """
+    Замеряет время вычисления всех кратчайших путей разными алгоритмами.
+
+    Args:
+        matrix: Матрица весов (0 - ребра нет)
+        repeats: Количество повторов, берется лучшее время
+
+    Returns:
+        Словарь {название алгоритма: время в секундах}
+
+    Raises:
+        RuntimeError: если результаты алгоритмов не совпадают
+    """
+    matrix = np.asarray(matrix)
+    size = len(matrix)
+    non_negative = not (matrix < 0).any()
+
+    engines = {
+        "Флойд-Уоршелл": lambda: floyd_warshall(matrix),
+        "Беллман-Форд (из каждой вершины)": lambda: np.array([bellman_ford(matrix, v) for v in range(size)]),
+        "Шимбелл (возведение в квадрат)": lambda: shimbell_shortest_paths(matrix),
+        "Шимбелл (по одному ребру)": lambda: shimbell_shortest_paths(matrix, squaring=False),
+    }
+    if non_negative:
+        engines["Дейкстра (из каждой вершины)"] = lambda: np.array([dijkstra(matrix, v) for v in range(size)])
+
+    timings = {}
+    reference = None
+    for name, engine in engines.items():
+        best = float('inf')
+        for _ in range(repeats):
+            started = time.perf_counter()
+            result = engine()
+            best = min(best, time.perf_counter() - started)
+        if reference is None:
+            reference = result
+        elif not np.array_equal(result, reference):
+            raise RuntimeError(f"Результат алгоритма '{name}' не совпадает с Флойдом-Уоршеллом")
+        timings[name] = best
+
+    return timings
+
+
+if __name__ == "__main__":
+    for filename in (sys.argv[1] if len(sys.argv) > 1 else MATRIX_FILE, None):
+        if filename:
+            matrix = load_matrix(filename)
+            title = filename
+        else:
+            rng = np.random.default_rng(0)
+            matrix = rng.integers(1, 100, (200, 200)) * (rng.random((200, 200)) < 0.05)
+            title = "случайный граф на 200 вершин"
+
+        print(f"Все кратчайшие пути, {title}:")
+        for name, elapsed in benchmark(matrix).items():
+            print(f"  {name}: {elapsed:.4f} с")
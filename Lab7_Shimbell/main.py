@@ -1,8 +1,11 @@
 import random
+from functools import lru_cache
 from typing import List, Callable
 
-INFINITY = 10 ** 12
-MATRIX_SIZE = 10
+import numpy as np
+
+from Shimbell import ShimbellEngine, load_matrix, tropical_product, to_sentinel, from_sentinel
+
 MATRIX_FILE = "Matrix_Mass/g42.txt"
 
 
@@ -21,45 +24,45 @@ def multiply_matrices(
         operation: Функция для выбора значения (min или max)
 
     Returns:
-        Результирующая матрица после умножения
+        Результирующая матрица после умножения (0 - пути нет)
     """
-    result_matrix = [[INFINITY for _ in range(MATRIX_SIZE)] for _ in range(MATRIX_SIZE)]
-
-    for i in range(MATRIX_SIZE):
-        for j in range(MATRIX_SIZE):
-            path_weights = []
+    mode = 'min' if operation is min else 'max'
+    result = tropical_product(to_sentinel(matrix_a, mode), to_sentinel(matrix_b, mode), mode)
+    return from_sentinel(result)
 
-            for k in range(MATRIX_SIZE):
-                if matrix_a[i][k] != 0 and matrix_b[k][j] != 0:
-                    path_weights.append(matrix_a[i][k] + matrix_b[k][j])
 
-            if path_weights:
-                result_matrix[i][j] = operation(path_weights)
-            else:
-                result_matrix[i][j] = 0
-
-    return result_matrix
+@lru_cache(maxsize=None)
+def get_engine(filename: str = MATRIX_FILE) -> ShimbellEngine:
+    """Возвращает движок Шимбелла, базовая матрица читается с диска один раз."""
+    return ShimbellEngine(filename)
 
 
 def find_min_paths(matrix: List[List[int]]) -> List[List[int]]:
-    """Находит матрицу минимальных путей через умножение матриц."""
-    base_matrix = read_matrix_from_file(MATRIX_FILE)
-    return multiply_matrices(matrix, base_matrix, min)
+    """Находит матрицу минимальных путей через умножение матриц (0 - пути нет)."""
+    return from_sentinel(get_engine().step(to_sentinel(matrix, 'min'), 'min'))
 
 
 def find_max_paths(matrix: List[List[int]]) -> List[List[int]]:
-    """Находит матрицу максимальных путей через умножение матриц."""
-    base_matrix = read_matrix_from_file(MATRIX_FILE)
-    return multiply_matrices(matrix, base_matrix, max)
+    """Находит матрицу максимальных путей через умножение матриц (0 - пути нет)."""
+    return from_sentinel(get_engine().step(to_sentinel(matrix, 'max'), 'max'))
 
 
-def print_matrix(matrix: List[List[int]]) -> None:
+def print_matrix(matrix) -> None:
     """Выводит матрицу в читаемом формате."""
     for row in matrix:
-        print(" ".join(f"{value:4d}" if value != INFINITY else "  INF" for value in row))
+        print(" ".join(_format_value(value) for value in row))
     print()
 
 
+def _format_value(value) -> str:
+    """Форматирует элемент матрицы, бесконечность означает отсутствие пути."""
+    if value == np.inf:
+        return "  INF"
+    if value == -np.inf:
+        return " -INF"
+    return f"{int(value):4d}"
+
+
 def read_matrix_from_file(filename: str) -> List[List[int]]:
     """
     Читает матрицу из файла и устанавливает диагональные элементы в 0.
@@ -71,14 +74,12 @@ def read_matrix_from_file(filename: str) -> List[List[int]]:
         Прочитанная матрица с нулевой диагональю
     """
     try:
-        with open(filename, 'r') as file:
-            matrix = [list(map(int, line.split())) for line in file]
+        matrix = np.array(load_matrix(filename), dtype=np.int64)
 
         # Обнуляем диагональ
-        for i in range(len(matrix)):
-            matrix[i][i] = 0
+        np.fill_diagonal(matrix, 0)
 
-        return matrix
+        return matrix.tolist()
     except FileNotFoundError:
         print(f"Ошибка: файл {filename} не найден")
         raise
@@ -87,12 +88,12 @@ def read_matrix_from_file(filename: str) -> List[List[int]]:
         raise
 
 
-def generate_random_matrix(size: int = MATRIX_SIZE) -> List[List[int]]:
+def generate_random_matrix(size: int) -> List[List[int]]:
     """
     Генерирует случайную матрицу смежности.
 
     Args:
-        size: Размер матрицы (по умолчанию MATRIX_SIZE)
+        size: Размер матрицы
 
     Returns:
         Сгенерированная матрица с нулевой диагональю
@@ -123,23 +124,52 @@ def get_user_choice() -> tuple:
         raise
 
 
+def print_all_lengths(engine: ShimbellEngine, max_length: int, mode: str, result_type: str) -> None:
+    """
+    Выводит матрицы путей всех длин от 1 до max_length и восстанавливает путь.
+
+    Args:
+        engine: Движок метода Шимбелла
+        max_length: Наибольшая длина пути
+        mode: 'min' или 'max'
+        result_type: Название типа путей для вывода
+    """
+    for length, matrix in engine.iter_all_lengths(max_length, mode):
+        print(f"Матрица {result_type} путей длины {length}:")
+        print_matrix(matrix)
+
+    source = int(input("Введите начальную вершину пути: "))
+    target = int(input("Введите конечную вершину пути: "))
+    length = int(input(f"Введите длину пути (1-{max_length}): "))
+    if not (1 <= source <= engine.size and 1 <= target <= engine.size):
+        raise ValueError(f"Номер вершины должен быть от 1 до {engine.size}")
+
+    path = engine.reconstruct_path(source - 1, target - 1, length, mode)
+    if path is None:
+        print(f"Пути длины {length} из {source} в {target} нет")
+    else:
+        print("Путь: " + " -> ".join(str(vertex + 1) for vertex in path))
+
+
 def main() -> None:
     """Основная функция программы."""
     try:
         search_type, path_length = get_user_choice()
 
-        matrix = read_matrix_from_file(MATRIX_FILE)
+        engine = get_engine(MATRIX_FILE)
         print("Исходная матрица:")
-        print_matrix(matrix)
+        print_matrix(engine.base)
+
+        mode = 'min' if search_type == 0 else 'max'
+        result_type = "минимальных" if search_type == 0 else "максимальных"
 
-        # Выбираем операцию в зависимости от типа поиска
-        operation = find_min_paths if search_type == 0 else find_max_paths
+        if input("Вывести матрицы для всех длин от 1 до n с восстановлением путей? (y/n): ").strip().lower() == 'y':
+            print_all_lengths(engine, path_length, mode, result_type)
+            return
 
-        # Применяем операцию (n-1) раз для пути длины n
-        for _ in range(path_length - 1):
-            matrix = operation(matrix)
+        # Путь длины n - n-я степень матрицы, O(log n) умножений
+        matrix = engine.power(path_length, mode)
 
-        result_type = "минимальных" if search_type == 0 else "максимальных"
         print(f"Матрица {result_type} путей длины {path_length}:")
         print_matrix(matrix)
 
@@ -0,0 +1,150 @@
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+# Количество возможных значений байта - ширина строки таблицы переходов
+BYTE_VALUES = 256
+# Наибольшее количество элементов (байты блока x состояния) в массиве
+# функций переходов блока: int32, то есть 32 МиБ независимо от числа состояний
+FUNCTION_ELEMENTS = 1 << 23
+
+
+class CompiledDFA:
+    """
+    Скомпилированное представление DFA для быстрого распознавания.
+
+    Состояния нумеруются числами 0..n-1, символы алфавита заменяются
+    их байтовыми кодами (Latin-1). Таблица переходов - плоская матрица
+    (n + 1) x 256, строка n - поглощающее состояние ошибки, в которое
+    ведут неопределенные переходы. Проверка символов выполняется один раз
+    для всей строки через bytes.translate, после чего цикл распознавания
+    не делает ни одной проверки.
+
+    Attributes:
+        state_names: Имена состояний по номерам
+        initial_state: Номер начального состояния
+        error_state: Номер состояния ошибки (равен количеству состояний)
+        accepting: Булев массив принимающих состояний (длины n + 1)
+        table: Матрица переходов int32 формы (n + 1, 256)
+        alphabet_bytes: Байтовые коды символов алфавита
+    """
+
+    def __init__(self, initial_state: str, accept_states: Set[str], alphabet: Set[str],
+                 transitions: Dict[str, Dict[str, str]]):
+        """
+        Args:
+            initial_state: Начальное состояние
+            accept_states: Принимающие состояния
+            alphabet: Алфавит из односимвольных строк с кодами меньше 256
+            transitions: Таблица переходов {состояние: {символ: состояние}}
+
+        Raises:
+            ValueError: если символ алфавита не кодируется одним байтом
+        """
+        for symbol in alphabet:
+            if len(symbol) != 1 or ord(symbol) >= BYTE_VALUES:
+                raise ValueError(f"Символ '{symbol}' нельзя представить одним байтом")
+
+        self.state_names: List[str] = list(transitions)
+        self._state_index = {state: index for index, state in enumerate(self.state_names)}
+        self.num_states = len(self.state_names)
+        self.initial_state = self._state_index[initial_state]
+        self.error_state = self.num_states
+        self.alphabet_bytes = bytes(sorted(ord(symbol) for symbol in alphabet))
+
+        self.table = np.full((self.num_states + 1, BYTE_VALUES), self.error_state, dtype=np.int32)
+        for state, moves in transitions.items():
+            for symbol, next_state in moves.items():
+                if symbol in alphabet:
+                    self.table[self._state_index[state], ord(symbol)] = self._state_index[next_state]
+
+        self.accepting = np.zeros(self.num_states + 1, dtype=bool)
+        self.accepting[[self._state_index[state] for state in accept_states]] = True
+
+        # Строки таблицы ссылаются прямо на строки следующих состояний:
+        # шаг цикла - одна индексация списка без промежуточных номеров
+        self._rows = [[None] * BYTE_VALUES for _ in range(self.num_states + 1)]
+        for state, row in enumerate(self.table.tolist()):
+            self._rows[state][:] = [self._rows[next_state] for next_state in row]
+        self._row_state = {id(row): state for state, row in enumerate(self._rows)}
+
+    def state_index(self, state: str) -> int:
+        """Возвращает номер состояния по имени."""
+        return self._state_index[state]
+
+    def find_invalid(self, data: bytes) -> int:
+        """
+        Ищет первый байт, не принадлежащий алфавиту.
+
+        Returns:
+            Код недопустимого байта или -1, если все символы допустимы
+        """
+        invalid = data.translate(None, self.alphabet_bytes)
+        return invalid[0] if invalid else -1
+
+    def run(self, data: bytes, start: Optional[int] = None) -> int:
+        """
+        Прогоняет автомат по байтам без проверки символов.
+
+        Недопустимые символы и неопределенные переходы приводят
+        в состояние ошибки, из которого автомат не выходит.
+
+        Args:
+            data: Входные байты
+            start: Номер начального состояния (по умолчанию initial_state)
+
+        Returns:
+            Номер конечного состояния
+        """
+        row = self._rows[self.initial_state if start is None else start]
+        for byte in data:
+            row = row[byte]
+        return self._row_state[id(row)]
+
+    def accepts(self, data: bytes) -> bool:
+        """Проверяет, принимает ли автомат строку байтов."""
+        return bool(self.accepting[self.run(data)])
+
+    def transition_function(self, data: bytes) -> np.ndarray:
+        """
+        Вычисляет функцию переходов строки для всех начальных состояний сразу.
+
+        Args:
+            data: Входные байты
+
+        Returns:
+            Массив f длины n + 1, где f[s] - состояние после чтения data из s
+        """
+        return transition_function(self.table, data)
+
+
+def transition_function(table: np.ndarray, data) -> np.ndarray:
+    """
+    Функция переходов строки по таблице для всех начальных состояний.
+
+    Каждый байт задает отображение состояний (столбец таблицы), соседние
+    отображения попарно композируются векторно, за log(len(data)) уровней.
+    Данные обрабатываются блоками по FUNCTION_ELEMENTS // len(table) байт,
+    поэтому массив функций блока содержит не больше FUNCTION_ELEMENTS
+    элементов: память не зависит ни от длины входа, ни от числа состояний.
+
+    Args:
+        table: Матрица переходов формы (n + 1, 256)
+        data: Входные байты (bytes, memoryview или mmap)
+
+    Returns:
+        Массив f длины n + 1, где f[s] - состояние после чтения data из s
+    """
+    result = np.arange(len(table), dtype=np.int32)
+    columns = np.ascontiguousarray(table.T)
+    block = max(1, FUNCTION_ELEMENTS // len(table))
+    for start in range(0, len(data), block):
+        # functions[i][s] - состояние после i-го байта блока из состояния s
+        functions = columns[np.frombuffer(data[start:start + block], dtype=np.uint8)]
+        while len(functions) > 1:
+            if len(functions) % 2:
+                functions = np.concatenate([functions, np.arange(len(table), dtype=np.int32)[None, :]])
+            first, second = functions[0::2], functions[1::2]
+            functions = np.take_along_axis(second, first, axis=1)
+        result = functions[0][result]
+    return result
@@ -1,27 +1,136 @@
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple, Union
+
+from CompiledDFA import CompiledDFA
+from DFADefinition import definition_hash, load_definition, normalize_definition, save_definition
+from Minimization import minimize_definition
+from Regex import DEFAULT_MAX_STATES, compile_regex
+from Search import DFASearcher
+from ParallelDFA import run_parallel
+from StreamScanner import iter_acceptance, write_bitmap
 
 
 class DFA:
     """
     Детерминированный конечный автомат для распознавания языка.
 
-    Автомат принимает строки, содержащие определенные последовательности символов.
+    По умолчанию автомат принимает строки, содержащие определенные
+    последовательности символов. Другие автоматы задаются параметрами
+    конструктора или загружаются из файла (from_file).
     """
 
-    def __init__(self):
-        self.initial_state = 'q0'
+    # Проверка и компиляция выполняются один раз для каждого различного
+    # определения: результаты хранятся по хешу определения
+    _validated_hashes: Set[str] = set()
+    _compiled_cache: Dict[str, Optional[CompiledDFA]] = {}
+
+    def __init__(self, initial_state: str = 'q0', accept_states: Optional[Set[str]] = None,
+                 alphabet: Optional[Set[str]] = None, transitions: Optional[Dict[str, Dict[str, str]]] = None):
+        """
+        Args:
+            initial_state: Начальное состояние
+            accept_states: Принимающие состояния
+            alphabet: Алфавит (односимвольные строки)
+            transitions: Таблица переходов {состояние: {символ: состояние}}
+        """
+        if transitions is None:
+            accept_states = {'q1'} if accept_states is None else accept_states
+            alphabet = {'a', 'b', 'c', 'd'} if alphabet is None else alphabet
+
+            # Таблица переходов между состояниями
+            transitions = {
+                'q0': {'a': 'q0', 'b': 'q0', 'c': 'q1', 'd': 'q0'},
+                'q1': {'a': 'q0', 'b': 'q0', 'c': 'q2', 'd': 'q0'},
+                'q2': {'a': 'q0', 'b': 'q0', 'c': 'q1', 'd': 'q0'}
+            }
+
+        self.initial_state = initial_state
         self.current_state = self.initial_state
-        self.accept_states = {'q1'}
-        self.alphabet = {'a', 'b', 'c', 'd'}
-
-        # Таблица переходов между состояниями
-        self.transitions = {
-            'q0': {'a': 'q0', 'b': 'q0', 'c': 'q1', 'd': 'q0'},
-            'q1': {'a': 'q0', 'b': 'q0', 'c': 'q2', 'd': 'q0'},
-            'q2': {'a': 'q0', 'b': 'q0', 'c': 'q1', 'd': 'q0'}
+        self.accept_states = set(accept_states or ())
+        self.alphabet = set(alphabet or ())
+        self.transitions = transitions
+
+        self._hash = definition_hash(self.to_definition())
+        if self._hash not in DFA._validated_hashes:
+            self._validate_automaton()
+            DFA._validated_hashes.add(self._hash)
+        self._compiled: Optional[CompiledDFA] = None
+        self._searcher: Optional[DFASearcher] = None
+
+    @classmethod
+    def from_definition(cls, definition: dict) -> 'DFA':
+        """
+        Создает автомат по словарю определения.
+
+        Args:
+            definition: Словарь с ключами initial_state, accept_states, alphabet, transitions
+
+        Raises:
+            ValueError: если определение некорректно
+        """
+        definition = normalize_definition(definition)
+        return cls(definition['initial_state'], definition['accept_states'],
+                   definition['alphabet'], definition['transitions'])
+
+    @classmethod
+    def from_file(cls, filename: str) -> 'DFA':
+        """
+        Загружает автомат из JSON или двоичного файла (.dfa, .bin).
+
+        Raises:
+            FileNotFoundError: если файл не найден
+            ValueError: если определение некорректно
+        """
+        return cls.from_definition(load_definition(filename))
+
+    @classmethod
+    def from_regex(cls, pattern: str, alphabet: Optional[Set[str]] = None,
+                   max_states: int = DEFAULT_MAX_STATES) -> 'DFA':
+        """
+        Строит автомат по регулярному выражению (регулярное выражение -> NFA Томпсона -> DFA).
+
+        Для выражений с очень большим полным DFA вместо этого следует
+        использовать Regex.compile_regex - он строит состояния лениво.
+
+        Args:
+            pattern: Регулярное выражение (совпадение со всей строкой)
+            alphabet: Алфавит (по умолчанию - символы выражения)
+            max_states: Наибольшее количество состояний DFA
+
+        Raises:
+            ValueError: если выражение некорректно или DFA слишком велик
+        """
+        return cls.from_definition(compile_regex(pattern, alphabet, max_states).to_definition())
+
+    def to_definition(self) -> dict:
+        """Возвращает определение автомата в виде словаря."""
+        return {
+            'initial_state': self.initial_state,
+            'accept_states': self.accept_states,
+            'alphabet': self.alphabet,
+            'transitions': self.transitions,
         }
 
-        self._validate_automaton()
+    def save(self, filename: str) -> None:
+        """Сохраняет определение автомата в JSON или двоичный файл (.dfa, .bin)."""
+        save_definition(self.to_definition(), filename)
+
+    def minimize(self) -> Tuple['DFA', dict]:
+        """
+        Строит минимальный эквивалентный автомат (алгоритм Хопкрофта).
+
+        Недостижимые состояния удаляются, тупиковые состояния и неопределенные
+        переходы сводятся в одно поглощающее состояние: минимальный автомат
+        полон и отвергает слова, которые исходный отвергал или на которых
+        встречал неопределенный переход.
+
+        Returns:
+            Кортеж (новый автомат, отчет): отчет содержит mapping
+            {старое состояние: новое или None}, unreachable, dead,
+            states_before и states_after
+        """
+        definition, report = minimize_definition(self.initial_state, self.accept_states,
+                                                 self.alphabet, self.transitions)
+        return DFA.from_definition(definition), report
 
     def _validate_automaton(self) -> None:
         """Проверяет корректность определения автомата."""
@@ -58,7 +167,7 @@ class DFA:
             ValueError: если символ не принадлежит алфавиту
         """
         if symbol not in self.alphabet:
-            raise ValueError(f"Недопустимый символ: '{symbol}'. Допустимые символы: {self.alphabet}")
+            self._raise_invalid_symbol(symbol)
 
         if symbol not in self.transitions[self.current_state]:
             raise ValueError(f"Неопределенный переход из состояния {self.current_state} по символу '{symbol}'")
@@ -79,6 +188,110 @@ class DFA:
         Raises:
             ValueError: если строка содержит недопустимые символы
         """
+        compiled = self.compile()
+        if compiled is None:
+            return self._process_by_symbol(input_string)
+
+        try:
+            data = input_string.encode('latin-1')
+        except UnicodeEncodeError as error:
+            self._raise_invalid_symbol(input_string[error.start])
+
+        invalid = compiled.find_invalid(data)
+        if invalid != -1:
+            self._raise_invalid_symbol(chr(invalid))
+
+        state = compiled.run(data)
+        if state == compiled.error_state:
+            # Неопределенный переход: повторяем посимвольно ради точного сообщения
+            return self._process_by_symbol(input_string)
+
+        self.current_state = compiled.state_names[state]
+        return bool(compiled.accepting[state])
+
+    def process_large_input(self, source: Union[bytes, str], workers: Optional[int] = None) -> bool:
+        """
+        Проверяет большой вход (байты или файл) параллельно по частям.
+
+        Args:
+            source: Входные байты (Latin-1) или имя файла
+            workers: Количество процессов (по умолчанию - число ядер)
+
+        Returns:
+            True если автомат принимает вход, иначе False
+
+        Raises:
+            ValueError: если вход содержит недопустимые символы или неопределенные переходы
+        """
+        compiled = self.compile()
+        if compiled is None:
+            raise ValueError("Алфавит автомата нельзя представить байтами")
+
+        state = run_parallel(compiled, source, workers)
+        if state == compiled.error_state:
+            raise ValueError("Вход содержит недопустимые символы или неопределенные переходы")
+
+        self.current_state = compiled.state_names[state]
+        return bool(compiled.accepting[state])
+
+    def search(self, source: Union[bytes, str, Iterable[bytes]]) -> Iterator[int]:
+        """
+        Ищет в потоке все позиции, где заканчивается слово языка автомата.
+
+        Args:
+            source: Байты (Latin-1), имя файла или последовательность порций байтов
+
+        Yields:
+            Смещения концов совпадений (включая перекрывающиеся)
+        """
+        yield from self._get_searcher().iter_match_ends(source)
+
+    def find_matches(self, data: bytes) -> Iterator[Tuple[int, int]]:
+        """
+        Ищет непересекающиеся совпадения: самое левое начало, затем самый длинный конец.
+
+        Yields:
+            Пары (начало, конец): data[начало:конец] принимается автоматом
+        """
+        yield from self._get_searcher().iter_matches(data)
+
+    def _get_searcher(self) -> DFASearcher:
+        """Возвращает автомат поиска, создавая его при первом обращении."""
+        compiled = self.compile()
+        if compiled is None:
+            raise ValueError("Алфавит автомата нельзя представить байтами")
+        if self._searcher is None:
+            self._searcher = DFASearcher(self.initial_state, self.accept_states, self.alphabet,
+                                         self.transitions, compiled)
+        return self._searcher
+
+    def compile(self) -> Optional[CompiledDFA]:
+        """
+        Компилирует автомат в целочисленную таблицу переходов.
+
+        Результат сохраняется в общем кеше по хешу определения
+        и используется в process_input.
+
+        Returns:
+            Скомпилированный автомат или None, если символы алфавита
+            не представимы одним байтом
+        """
+        if self._compiled is None:
+            if self._hash not in DFA._compiled_cache:
+                try:
+                    DFA._compiled_cache[self._hash] = CompiledDFA(self.initial_state, self.accept_states,
+                                                                  self.alphabet, self.transitions)
+                except ValueError:
+                    DFA._compiled_cache[self._hash] = None
+            self._compiled = DFA._compiled_cache[self._hash]
+        return self._compiled
+
+    def _raise_invalid_symbol(self, symbol: str) -> None:
+        """Сообщает о символе не из алфавита."""
+        raise ValueError(f"Недопустимый символ: '{symbol}'. Допустимые символы: {self.alphabet}")
+
+    def _process_by_symbol(self, input_string: str) -> bool:
+        """Обрабатывает строку посимвольно через process_symbol."""
         self.reset()
 
         for char in input_string:
@@ -149,6 +362,43 @@ class DFATester:
             results.append(self.test_single_word(word))
         return results
 
+    def test_file(self, filename: str, delimiter: Optional[bytes] = b'\n') -> Iterator[bool]:
+        """
+        Потоково тестирует слова файла (строки или токены) без загрузки его в память.
+
+        Args:
+            filename: Путь к файлу
+            delimiter: Однобайтовый разделитель слов; None - пробельные символы
+
+        Yields:
+            Принимается ли очередное слово (слова с ошибками не принимаются)
+        """
+        compiled = self.dfa.compile()
+        if compiled is None:
+            raise ValueError("Алфавит автомата нельзя представить байтами")
+
+        for accepted in iter_acceptance(compiled, filename, delimiter):
+            yield from accepted.tolist()
+
+    def test_file_to_bitmap(self, filename: str, output_file: str,
+                            delimiter: Optional[bytes] = b'\n') -> Dict[str, int]:
+        """
+        Тестирует слова файла и записывает результаты битовой картой (1 бит на слово).
+
+        Args:
+            filename: Путь к входному файлу
+            output_file: Путь к файлу битовой карты
+            delimiter: Однобайтовый разделитель слов; None - пробельные символы
+
+        Returns:
+            Словарь с количеством слов, принятых слов и слов с ошибками
+        """
+        compiled = self.dfa.compile()
+        if compiled is None:
+            raise ValueError("Алфавит автомата нельзя представить байтами")
+
+        return write_bitmap(compiled, filename, output_file, delimiter)
+
     def print_results(self, results: List[Dict[str, str]]) -> None:
         """Выводит результаты тестирования в читаемом формате."""
         print("\nРЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ DFA")
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import struct
+from typing import Dict
+
+import numpy as np
+
+BINARY_MAGIC = b'DFA1'
+BINARY_EXTENSIONS = ('.dfa', '.bin')
+# Заголовок: количество состояний, количество символов, номер начального состояния
+HEADER = struct.Struct('<4sIII')
+NO_TRANSITION = -1
+
+DEFINITION_KEYS = ('initial_state', 'accept_states', 'alphabet', 'transitions')
+
+
+def normalize_definition(definition: dict) -> dict:
+    """
+    Приводит определение автомата к каноническому виду.
+
+    Args:
+        definition: Словарь с ключами initial_state, accept_states, alphabet, transitions
+
+    Returns:
+        Словарь с множествами accept_states и alphabet
+
+    Raises:
+        ValueError: если в определении не хватает ключей или они неверного типа
+    """
+    missing = [key for key in DEFINITION_KEYS if key not in definition]
+    if missing:
+        raise ValueError(f"В определении автомата отсутствуют ключи: {missing}")
+    if not isinstance(definition['transitions'], dict):
+        raise ValueError("Таблица переходов должна быть словарем {состояние: {символ: состояние}}")
+
+    return {
+        'initial_state': str(definition['initial_state']),
+        'accept_states': set(definition['accept_states']),
+        'alphabet': set(definition['alphabet']),
+        'transitions': {
+            str(state): {str(symbol): str(target) for symbol, target in moves.items()}
+            for state, moves in definition['transitions'].items()
+        },
+    }
+
+
+def definition_hash(definition: dict) -> str:
+    """Возвращает хеш определения, не зависящий от порядка элементов множеств."""
+    canonical = json.dumps({
+        'initial_state': definition['initial_state'],
+        'accept_states': sorted(definition['accept_states']),
+        'alphabet': sorted(definition['alphabet']),
+        'transitions': definition['transitions'],
+    }, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def save_json(definition: dict, filename: str) -> None:
+    """Сохраняет определение автомата в JSON."""
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump({
+            'initial_state': definition['initial_state'],
+            'accept_states': sorted(definition['accept_states']),
+            'alphabet': sorted(definition['alphabet']),
+            'transitions': definition['transitions'],
+        }, file, ensure_ascii=False, indent=2)
+
+
+def load_json(filename: str) -> dict:
+    """Читает определение автомата из JSON."""
+    with open(filename, 'r', encoding='utf-8') as file:
+        try:
+            return normalize_definition(json.load(file))
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Некорректный JSON в файле {filename}: {error}")
+
+
+def save_binary(definition: dict, filename: str) -> None:
+    """
+    Сохраняет определение автомата в компактном двоичном формате.
+
+    Формат: заголовок HEADER, имена состояний и символы алфавита
+    (UTF-8, разделены нулевым байтом, с длиной uint32 перед каждым блоком),
+    битовая карта принимающих состояний и таблица переходов int32
+    (состояния x символы, NO_TRANSITION - перехода нет).
+    """
+    states = list(definition['transitions'])
+    symbols = sorted(definition['alphabet'])
+    state_index = {state: index for index, state in enumerate(states)}
+    symbol_index = {symbol: index for index, symbol in enumerate(symbols)}
+
+    table = np.full((len(states), len(symbols)), NO_TRANSITION, dtype='<i4')
+    for state, moves in definition['transitions'].items():
+        for symbol, target in moves.items():
+            if symbol in symbol_index:
+                table[state_index[state], symbol_index[symbol]] = state_index[target]
+
+    accepting = np.array([state in definition['accept_states'] for state in states], dtype=bool)
+
+    with open(filename, 'wb') as file:
+        file.write(HEADER.pack(BINARY_MAGIC, len(states), len(symbols), state_index[definition['initial_state']]))
+        for names in (states, symbols):
+            block = '\0'.join(names).encode('utf-8')
+            file.write(struct.pack('<I', len(block)))
+            file.write(block)
+        file.write(np.packbits(accepting, bitorder='little').tobytes())
+        file.write(table.tobytes())
+
+
+def load_binary(filename: str) -> dict:
+    """
+    Читает определение автомата из двоичного формата save_binary.
+
+    Raises:
+        ValueError: если файл поврежден или имеет другой формат
+    """
+    with open(filename, 'rb') as file:
+        data = file.read()
+
+    try:
+        magic, num_states, num_symbols, initial = HEADER.unpack_from(data, 0)
+        if magic != BINARY_MAGIC:
+            raise ValueError(f"Файл {filename} не является двоичным определением автомата")
+
+        offset = HEADER.size
+        blocks = []
+        for _ in range(2):
+            (length,) = struct.unpack_from('<I', data, offset)
+            offset += 4
+            blocks.append(data[offset:offset + length].decode('utf-8'))
+            offset += length
+        states = blocks[0].split('\0') if num_states else []
+        symbols = blocks[1].split('\0') if num_symbols else []
+
+        accept_bytes = -(-num_states // 8)
+        accepting = np.unpackbits(np.frombuffer(data, dtype=np.uint8, count=accept_bytes, offset=offset),
+                                  bitorder='little')[:num_states]
+        offset += accept_bytes
+        table = np.frombuffer(data, dtype='<i4', count=num_states * num_symbols, offset=offset)
+        table = table.reshape(num_states, num_symbols)
+    except (struct.error, UnicodeDecodeError) as error:
+        raise ValueError(f"Поврежденный файл определения автомата {filename}: {error}")
+
+    if len(states) != num_states or len(symbols) != num_symbols or initial >= max(num_states, 1):
+        raise ValueError(f"Поврежденный файл определения автомата {filename}")
+    if ((table < NO_TRANSITION) | (table >= num_states)).any():
+        raise ValueError(f"Поврежденный файл определения автомата {filename}: неверный номер состояния")
+
+    transitions: Dict[str, Dict[str, str]] = {}
+    for state, row in zip(states, table.tolist()):
+        transitions[state] = {symbol: states[target] for symbol, target in zip(symbols, row)
+                              if target != NO_TRANSITION}
+
+    return {
+        'initial_state': states[initial] if states else '',
+        'accept_states': {state for state, accepted in zip(states, accepting) if accepted},
+        'alphabet': set(symbols),
+        'transitions': transitions,
+    }
+
+
+def load_definition(filename: str) -> dict:
+    """Читает определение автомата из JSON или двоичного файла (по расширению)."""
+    if filename.endswith(BINARY_EXTENSIONS):
+        return load_binary(filename)
+    return load_json(filename)
+
+
+def save_definition(definition: dict, filename: str) -> None:
+    """Сохраняет определение автомата в JSON или двоичный файл (по расширению)."""
+    if filename.endswith(BINARY_EXTENSIONS):
+        save_binary(definition, filename)
+    else:
+        save_json(definition, filename)
@@ -0,0 +1,205 @@
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+# Имя поглощающего состояния, если в исходном автомате не было тупиковых
+SINK_STATE = 'sink'
+
+
+def _reachable(start_states: List[str], edges: Dict[str, Set[str]]) -> Set[str]:
+    """Возвращает состояния, достижимые из start_states по ребрам edges."""
+    seen = set(start_states)
+    queue = deque(start_states)
+    while queue:
+        state = queue.popleft()
+        for target in edges.get(state, ()):
+            if target not in seen:
+                seen.add(target)
+                queue.append(target)
+    return seen
+
+
+def _refine(num_states: int, symbols: List[str], delta: List[List[int]],
+            accepting: List[bool]) -> List[int]:
+    """
+    Алгоритм Хопкрофта для полного автомата с состояниями 0..num_states-1.
+
+    Разбиение уточняется по парам (блок, символ) из очереди; при расщеплении
+    блока в очередь добавляется меньшая часть, поэтому каждое состояние
+    попадает в очередь O(log n) раз и общее время - O(n * k * log n).
+    Блоки - отрезки массива elements: состояния, переходящие в сплиттер,
+    переставляются в начало отрезка своего блока, поэтому расщепление стоит
+    O(|часть|), а новый номер получает только меньшая часть.
+
+    Returns:
+        Номер блока (класса эквивалентности) для каждого состояния
+    """
+    # Обратные переходы: inverse[c][t] - состояния, переходящие в t по символу c
+    inverse = [[[] for _ in range(num_states)] for _ in symbols]
+    for state, row in enumerate(delta):
+        for symbol, target in enumerate(row):
+            inverse[symbol][target].append(state)
+
+    # Сначала принимающие состояния, затем остальные; блок - отрезок [first, last)
+    elements = [state for state in range(num_states) if accepting[state]]
+    finals = len(elements)
+    elements += [state for state in range(num_states) if not accepting[state]]
+    location = [0] * num_states
+    for position, state in enumerate(elements):
+        location[state] = position
+
+    first: List[int] = []
+    last: List[int] = []
+    block_of = [0] * num_states
+    for start, stop in ((0, finals), (finals, num_states)):
+        if start < stop:
+            for state in elements[start:stop]:
+                block_of[state] = len(first)
+            first.append(start)
+            last.append(stop)
+    # Количество отмеченных состояний в начале отрезка каждого блока
+    marked = [0] * len(first)
+
+    smaller = min(range(len(first)), key=lambda index: last[index] - first[index])
+    pending = {(smaller, symbol) for symbol in range(len(symbols))} if len(first) > 1 else set()
+    worklist = deque(sorted(pending))
+
+    while worklist:
+        splitter, symbol = worklist.popleft()
+        pending.discard((splitter, symbol))
+
+        # Состояния, переходящие в блок splitter по символу, отмечаются в своих блоках
+        predecessors = [state for target in elements[first[splitter]:last[splitter]]
+                        for state in inverse[symbol][target]]
+        touched = []
+        for state in predecessors:
+            block = block_of[state]
+            if not marked[block]:
+                touched.append(block)
+            position = first[block] + marked[block]
+            other, here = elements[position], location[state]
+            elements[position], elements[here] = state, other
+            location[state], location[other] = position, here
+            marked[block] += 1
+
+        for index in touched:
+            count, marked[index] = marked[index], 0
+            size = last[index] - first[index]
+            if count == size:
+                continue
+
+            # Меньшая часть получает новый номер, большая остается на месте
+            middle = first[index] + count
+            if count <= size - count:
+                first.append(first[index])
+                last.append(middle)
+                first[index] = middle
+            else:
+                first.append(middle)
+                last.append(last[index])
+                last[index] = middle
+            marked.append(0)
+            new_index = len(first) - 1
+            for state in elements[first[new_index]:last[new_index]]:
+                block_of[state] = new_index
+
+            # Если (index, c) уже в очереди, нужны обе части, иначе достаточно
+            # меньшей - в обоих случаях добавляется пара с новым номером
+            for other_symbol in range(len(symbols)):
+                item = (new_index, other_symbol)
+                if item not in pending:
+                    pending.add(item)
+                    worklist.append(item)
+
+    return block_of
+
+
+def minimize_definition(initial_state: str, accept_states: Set[str], alphabet: Set[str],
+                        transitions: Dict[str, Dict[str, str]]) -> Tuple[dict, dict]:
+    """
+    Строит минимальный автомат, распознающий тот же язык.
+
+    Недостижимые состояния удаляются. Тупиковые (из которых нельзя попасть
+    в принимающее) и неопределенные переходы сводятся в одно поглощающее
+    непринимающее состояние, поэтому минимальный автомат полон и отвергает
+    те же слова, что и исходный, не вызывая ошибок. Поглощающее состояние
+    получает имя первого тупикового (или SINK_STATE, если их не было) и
+    добавляется, только если в него есть переход. Остальные состояния
+    объединяются в классы эквивалентности алгоритмом Хопкрофта; класс
+    получает имя первого из своих состояний.
+
+    Returns:
+        Кортеж (определение минимального автомата, отчет): отчет содержит
+        mapping {старое состояние: новое или None}, unreachable, dead,
+        states_before и states_after
+    """
+    symbols = sorted(alphabet)
+    forward = {state: {target for symbol, target in moves.items() if symbol in alphabet}
+               for state, moves in transitions.items()}
+    backward: Dict[str, Set[str]] = {}
+    for state, targets in forward.items():
+        for target in targets:
+            backward.setdefault(target, set()).add(state)
+
+    reachable = _reachable([initial_state], forward)
+    productive = _reachable([state for state in accept_states if state in reachable], backward)
+    order = [state for state in transitions if state in reachable]
+    unreachable = [state for state in transitions if state not in reachable]
+    dead = [state for state in order if state not in productive]
+    live = [state for state in order if state in productive]
+
+    # Полный автомат: тупиковые состояния и отсутствующие переходы ведут в сток
+    index = {state: position for position, state in enumerate(live)}
+    sink = len(live)
+    delta = [[sink] * len(symbols) for _ in range(sink + 1)]
+    for state in live:
+        moves = transitions[state]
+        for position, symbol in enumerate(symbols):
+            target = moves.get(symbol)
+            if target in index:
+                delta[index[state]][position] = index[target]
+    accepting = [state in accept_states for state in live] + [False]
+
+    block_of = _refine(sink + 1, symbols, delta, accepting)
+
+    names: Dict[int, str] = {}
+    for state in live:
+        names.setdefault(block_of[index[state]], state)
+
+    # Сток нужен, если язык пуст или в него ведет хотя бы один переход
+    sink_used = initial_state not in index or any(sink in delta[position] for position in range(sink))
+    if sink_used:
+        # Если язык пуст, стоком становится само начальное состояние
+        sink_name = initial_state if initial_state not in index else (dead[0] if dead else SINK_STATE)
+        while sink_name in index:
+            sink_name += "'"
+        names[block_of[sink]] = sink_name
+
+    new_transitions: Dict[str, Dict[str, str]] = {}
+    for state in live:
+        name = names[block_of[index[state]]]
+        if name not in new_transitions:
+            new_transitions[name] = {
+                symbol: names[block_of[delta[index[state]][position]]]
+                for position, symbol in enumerate(symbols)
+            }
+    if sink_used:
+        new_transitions[sink_name] = {symbol: sink_name for symbol in symbols}
+
+    mapping: Dict[str, Optional[str]] = {state: None for state in transitions}
+    for state in order:
+        mapping[state] = names[block_of[index.get(state, sink)]]
+
+    definition = {
+        'initial_state': names[block_of[index.get(initial_state, sink)]],
+        'accept_states': {name for name in new_transitions if name in accept_states and name in index},
+        'alphabet': set(alphabet),
+        'transitions': new_transitions,
+    }
+    report = {
+        'mapping': mapping,
+        'unreachable': unreachable,
+        'dead': dead,
+        'states_before': len(transitions),
+        'states_after': len(new_transitions),
+    }
+    return definition, report
@@ -0,0 +1,129 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from CompiledDFA import CompiledDFA, transition_function
+
+# Размер части входа, обрабатываемой одной задачей
+DEFAULT_CHUNK_SIZE = 64 << 20
+# Меньше этого размера вход обрабатывается в текущем процессе
+MIN_PARALLEL_BYTES = 1 << 20
+
+
+def _file_chunk_function(table: np.ndarray, filename: str, start: int, stop: int) -> np.ndarray:
+    """Функция переходов части файла [start, stop), файл отображается в память."""
+    with open(filename, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        view = memoryview(data)[start:stop]
+        try:
+            return transition_function(table, view)
+        finally:
+            view.release()
+
+
+def _file_run(compiled: CompiledDFA, filename: str, chunk_size: int) -> int:
+    """Последовательный прогон по файлу от начального состояния, файл читается частями."""
+    state = compiled.initial_state
+    with open(filename, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return state
+            state = compiled.run(chunk, state)
+
+
+def _shared_chunk_function(table: np.ndarray, name: str, start: int, stop: int) -> np.ndarray:
+    """Функция переходов части входа из разделяемой памяти."""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        view = block.buf[start:stop]
+        try:
+            return transition_function(table, view)
+        finally:
+            view.release()
+    finally:
+        block.close()
+
+
+def _chunk_bounds(size: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """Делит вход на части не больше chunk_size байт."""
+    return [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+
+def compose(functions: List[np.ndarray], start: int) -> int:
+    """
+    Применяет функции переходов частей по порядку.
+
+    Args:
+        functions: Функции переходов частей входа в порядке следования
+        start: Начальное состояние
+
+    Returns:
+        Конечное состояние
+    """
+    state = start
+    for function in functions:
+        state = int(function[state])
+    return state
+
+
+def run_parallel(compiled: CompiledDFA, source: Union[bytes, str], workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Прогоняет автомат по большому входу параллельно.
+
+    Вход делится на части, для каждой части процесс вычисляет полную
+    функцию переходов (состояние -> состояние для всех начальных
+    состояний), затем функции композируются по порядку. Результат
+    совпадает с последовательным прогоном, а работа на часть не зависит
+    от того, в каком состоянии автомат в нее войдет. Без параллелизма
+    (один процесс или небольшой вход) функции не строятся: автомат
+    проходит вход по таблице от начального состояния.
+
+    Args:
+        compiled: Скомпилированный автомат
+        source: Входные байты или имя файла
+        workers: Количество процессов (по умолчанию - число ядер)
+        chunk_size: Размер части в байтах
+
+    Returns:
+        Номер конечного состояния (error_state при недопустимом символе
+        или неопределенном переходе)
+    """
+    workers = workers or os.cpu_count() or 1
+    is_file = isinstance(source, str)
+    size = os.path.getsize(source) if is_file else len(source)
+    chunk_size = max(1, min(chunk_size, -(-size // workers) if size else 1))
+
+    if not size:
+        return compiled.initial_state
+
+    if workers == 1 or size < MIN_PARALLEL_BYTES:
+        if not is_file:
+            return compiled.run(source)
+        return _file_run(compiled, source, chunk_size)
+
+    block = None
+    try:
+        if is_file:
+            task, target = _file_chunk_function, source
+        else:
+            block = shared_memory.SharedMemory(create=True, size=size)
+            block.buf[:size] = source
+            task, target = _shared_chunk_function, block.name
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(task, compiled.table, target, start, stop)
+                for start, stop in _chunk_bounds(size, chunk_size)
+            ]
+            functions = [future.result() for future in futures]
+    finally:
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    return compose(functions, compiled.initial_state)
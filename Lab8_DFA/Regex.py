@@ -0,0 +1,406 @@
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from CompiledDFA import BYTE_VALUES
+
+# Наибольшее количество состояний DFA в кеше ленивого автомата
+DEFAULT_MAX_STATES = 4096
+UNKNOWN = -1
+DEAD = 0
+
+
+class NFA:
+    """
+    Недетерминированный автомат Томпсона.
+
+    Каждое состояние имеет список eps-переходов и не более одного
+    перехода по множеству символов.
+
+    Attributes:
+        epsilon: Списки eps-переходов для каждого состояния
+        symbols: Множество символов перехода (None - перехода нет)
+        targets: Состояние, в которое ведет переход по символам
+        start: Начальное состояние
+        accept: Единственное принимающее состояние
+    """
+
+    def __init__(self):
+        self.epsilon: List[List[int]] = []
+        self.symbols: List[Optional[FrozenSet[str]]] = []
+        self.targets: List[int] = []
+        self.start = 0
+        self.accept = 0
+
+    def add_state(self) -> int:
+        """Добавляет состояние и возвращает его номер."""
+        self.epsilon.append([])
+        self.symbols.append(None)
+        self.targets.append(-1)
+        return len(self.epsilon) - 1
+
+    def closure(self, states) -> FrozenSet[int]:
+        """Возвращает eps-замыкание множества состояний."""
+        result = set(states)
+        stack = list(states)
+        while stack:
+            for target in self.epsilon[stack.pop()]:
+                if target not in result:
+                    result.add(target)
+                    stack.append(target)
+        return frozenset(result)
+
+
+class _Parser:
+    """
+    Рекурсивный разбор регулярного выражения с построением фрагментов Томпсона.
+
+    Грамматика: выражение = слагаемое ('|' слагаемое)*, слагаемое = множитель*,
+    множитель = атом ('*' | '+' | '?')*, атом = символ | '.' | '[...]' | '(' выражение ')'.
+    Без алфавита (alphabet=None) разбор только собирает в literals символы,
+    явно названные в атомах: '.' и отрицание класса ничего не добавляют.
+    """
+
+    def __init__(self, pattern: str, alphabet: Optional[Set[str]], nfa: NFA):
+        self.pattern = pattern
+        self.position = 0
+        self.alphabet = alphabet
+        self.nfa = nfa
+        self.literals: Set[str] = set()
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"Ошибка в регулярном выражении '{self.pattern}' в позиции {self.position}: {message}")
+
+    def peek(self) -> Optional[str]:
+        return self.pattern[self.position] if self.position < len(self.pattern) else None
+
+    def take(self) -> str:
+        char = self.pattern[self.position]
+        self.position += 1
+        return char
+
+    def parse(self) -> Tuple[int, int]:
+        fragment = self.expression()
+        if self.peek() is not None:
+            raise self.error(f"неожиданный символ '{self.peek()}'")
+        return fragment
+
+    def expression(self) -> Tuple[int, int]:
+        alternatives = [self.term()]
+        while self.peek() == '|':
+            self.take()
+            alternatives.append(self.term())
+        if len(alternatives) == 1:
+            return alternatives[0]
+
+        start, accept = self.nfa.add_state(), self.nfa.add_state()
+        for first, last in alternatives:
+            self.nfa.epsilon[start].append(first)
+            self.nfa.epsilon[last].append(accept)
+        return start, accept
+
+    def term(self) -> Tuple[int, int]:
+        start = accept = self.nfa.add_state()
+        while self.peek() is not None and self.peek() not in '|)':
+            first, last = self.factor()
+            self.nfa.epsilon[accept].append(first)
+            accept = last
+        return start, accept
+
+    def factor(self) -> Tuple[int, int]:
+        first, last = self.atom()
+        while self.peek() is not None and self.peek() in '*+?':
+            operator = self.take()
+            start, accept = self.nfa.add_state(), self.nfa.add_state()
+            self.nfa.epsilon[start].append(first)
+            self.nfa.epsilon[last].append(accept)
+            if operator in '*?':
+                self.nfa.epsilon[start].append(accept)
+            if operator in '*+':
+                self.nfa.epsilon[last].append(first)
+            first, last = start, accept
+        return first, last
+
+    def atom(self) -> Tuple[int, int]:
+        char = self.take()
+        if char == '(':
+            fragment = self.expression()
+            if self.peek() != ')':
+                raise self.error("ожидалась ')'")
+            self.take()
+            return fragment
+
+        if char == '[':
+            symbols = self.char_class()
+        elif char == '.':
+            symbols = set(self.alphabet or ())
+        elif char == '\\':
+            if self.peek() is None:
+                raise self.error("выражение заканчивается на '\\'")
+            symbols = {self.take()}
+            self.literals.update(symbols)
+        elif char in '*+?)|':
+            raise self.error(f"неожиданный символ '{char}'")
+        else:
+            symbols = {char}
+            self.literals.update(symbols)
+
+        invalid = symbols - self.alphabet if self.alphabet is not None else set()
+        if invalid:
+            raise self.error(f"символы {sorted(invalid)} не принадлежат алфавиту")
+
+        start, accept = self.nfa.add_state(), self.nfa.add_state()
+        self.nfa.symbols[start] = frozenset(symbols)
+        self.nfa.targets[start] = accept
+        return start, accept
+
+    def char_class(self) -> Set[str]:
+        negated = self.peek() == '^'
+        if negated:
+            self.take()
+
+        symbols = set()
+        while self.peek() != ']':
+            if self.peek() is None:
+                raise self.error("ожидалась ']'")
+            char = self.take()
+            if char == '\\' and self.peek() is not None:
+                char = self.take()
+            if self.peek() == '-' and self.position + 1 < len(self.pattern) and self.pattern[self.position + 1] != ']':
+                self.take()
+                last = self.take()
+                symbols.update(chr(code) for code in range(ord(char), ord(last) + 1))
+            else:
+                symbols.add(char)
+        self.take()
+
+        self.literals.update(symbols)
+        if negated:
+            return set(self.alphabet or ()) - symbols
+        return symbols
+
+
+def regex_to_nfa(pattern: str, alphabet: Optional[Set[str]] = None) -> Tuple[NFA, Set[str]]:
+    """
+    Строит автомат Томпсона по регулярному выражению.
+
+    Поддерживаются символы, '.', классы [abc], [a-d], [^a], экранирование '\\',
+    скобки, альтернатива '|' и операторы '*', '+', '?'.
+
+    Args:
+        pattern: Регулярное выражение
+        alphabet: Алфавит (по умолчанию - символы из атомов выражения: литералы,
+            экранированные символы и элементы классов с раскрытыми диапазонами)
+
+    Returns:
+        Кортеж (NFA, алфавит)
+
+    Raises:
+        ValueError: если выражение некорректно или использует символы не из алфавита
+    """
+    if alphabet is None:
+        collector = _Parser(pattern, None, NFA())
+        collector.parse()
+        alphabet = collector.literals
+    nfa = NFA()
+    nfa.start, nfa.accept = _Parser(pattern, set(alphabet), nfa).parse()
+    return nfa, set(alphabet)
+
+
+class LazyDFA:
+    """
+    DFA, построенный из NFA подмножествами по требованию.
+
+    Состояние DFA - eps-замкнутое множество состояний NFA; переход
+    вычисляется при первом обращении и запоминается в строке таблицы
+    (256 байтовых кодов), поэтому горячие состояния работают с той же
+    скоростью, что и скомпилированная таблица. Если количество состояний
+    в кеше превышает max_states, кеш сбрасывается целиком (кроме текущего
+    состояния) - память ограничена при любой сложности полного DFA.
+
+    Attributes:
+        alphabet: Алфавит автомата
+        max_states: Наибольшее количество состояний в кеше
+        evictions: Сколько раз кеш сбрасывался
+        misses: Количество вычисленных переходов
+    """
+
+    def __init__(self, nfa: NFA, alphabet: Set[str], max_states: int = DEFAULT_MAX_STATES):
+        for symbol in alphabet:
+            if len(symbol) != 1 or ord(symbol) >= BYTE_VALUES:
+                raise ValueError(f"Символ '{symbol}' нельзя представить одним байтом")
+
+        self.nfa = nfa
+        self.alphabet = alphabet
+        self.max_states = max(2, max_states)
+        self.evictions = 0
+        self.misses = 0
+
+        # Для каждого состояния NFA - байтовые коды его перехода
+        self._codes = [frozenset(ord(symbol) for symbol in symbols) if symbols else frozenset()
+                       for symbols in nfa.symbols]
+        self._flush()
+        self.initial_state = self._intern(nfa.closure([nfa.start]))
+
+    def _flush(self) -> None:
+        """Очищает кеш состояний, оставляя только мертвое состояние."""
+        self._sets: List[FrozenSet[int]] = [frozenset()]
+        self._index: Dict[FrozenSet[int], int] = {frozenset(): DEAD}
+        self._rows: List[List[int]] = [[DEAD] * BYTE_VALUES]
+        self._accepting: List[bool] = [False]
+
+    def _intern(self, states: FrozenSet[int]) -> int:
+        """Возвращает номер состояния DFA для множества, добавляя его в кеш."""
+        index = self._index.get(states)
+        if index is None:
+            index = len(self._sets)
+            self._sets.append(states)
+            self._index[states] = index
+            self._rows.append([UNKNOWN] * BYTE_VALUES)
+            self._accepting.append(self.nfa.accept in states)
+        return index
+
+    @property
+    def num_cached_states(self) -> int:
+        """Количество состояний DFA в кеше."""
+        return len(self._sets)
+
+    def is_accepting(self, state: int) -> bool:
+        """Проверяет, является ли состояние принимающим."""
+        return self._accepting[state]
+
+    def is_dead(self, state: int) -> bool:
+        """Проверяет, что из состояния нельзя попасть в принимающее (пустое множество)."""
+        return state == DEAD
+
+    def step(self, state: int, byte: int) -> int:
+        """
+        Вычисляет переход по байту, добавляя новое состояние в кеш.
+
+        Номера состояний действительны до следующего сброса кеша, поэтому
+        результат всегда нужно использовать вместо старого номера.
+        """
+        next_state = self._rows[state][byte]
+        if next_state != UNKNOWN:
+            return next_state
+
+        self.misses += 1
+        moved = [self.nfa.targets[nfa_state] for nfa_state in self._sets[state] if byte in self._codes[nfa_state]]
+        target = self.nfa.closure(moved)
+
+        if target not in self._index and len(self._sets) >= self.max_states:
+            current = self._sets[state]
+            self._flush()
+            self.evictions += 1
+            state = self._intern(current)
+            self.initial_state = self._intern(self.nfa.closure([self.nfa.start]))
+
+        next_state = self._intern(target)
+        self._rows[state][byte] = next_state
+        return next_state
+
+    def run(self, data: bytes) -> int:
+        """
+        Прогоняет автомат по байтам.
+
+        Returns:
+            Номер конечного состояния (DEAD, если строка не может быть принята)
+        """
+        state = self.initial_state
+        rows = self._rows
+        for byte in data:
+            next_state = rows[state][byte]
+            if next_state == UNKNOWN:
+                next_state = self.step(state, byte)
+                rows = self._rows
+            state = next_state
+            if state == DEAD:
+                return DEAD
+        return state
+
+    def accepts(self, data: bytes) -> bool:
+        """Проверяет, принимает ли автомат строку байтов."""
+        # Сначала прогон: сброс кеша во время прогона заменяет списки состояний
+        state = self.run(data)
+        return self._accepting[state]
+
+    def scan(self, data: bytes, state: Optional[int] = None) -> Tuple[List[int], int]:
+        """
+        Прогоняет автомат по байтам, отмечая позиции, где он в принимающем состоянии.
+
+        Args:
+            data: Входные байты
+            state: Состояние, с которого продолжается прогон (по умолчанию начальное)
+
+        Returns:
+            Кортеж (список i + 1 для каждого байта i, после которого состояние
+            принимающее; конечное состояние для продолжения прогона)
+        """
+        state = self.initial_state if state is None else state
+        rows, accepting = self._rows, self._accepting
+        positions = []
+        for position, byte in enumerate(data, 1):
+            next_state = rows[state][byte]
+            if next_state == UNKNOWN:
+                next_state = self.step(state, byte)
+                rows, accepting = self._rows, self._accepting
+            state = next_state
+            if accepting[state]:
+                positions.append(position)
+        return positions, state
+
+    def to_definition(self, limit: Optional[int] = None) -> dict:
+        """
+        Строит полный DFA обходом всех достижимых подмножеств.
+
+        Args:
+            limit: Наибольшее количество состояний (по умолчанию max_states)
+
+        Returns:
+            Определение автомата для DFA.from_definition (состояния d0, d1, ...)
+
+        Raises:
+            ValueError: если полный DFA содержит больше limit состояний
+        """
+        limit = limit or self.max_states
+        symbols = sorted(self.alphabet)
+        start = self.nfa.closure([self.nfa.start])
+        names = {start: 'd0'}
+        queue = [start]
+        transitions: Dict[str, Dict[str, str]] = {}
+
+        while queue:
+            states = queue.pop()
+            moves = {}
+            for symbol in symbols:
+                code = ord(symbol)
+                target = self.nfa.closure(
+                    [self.nfa.targets[nfa_state] for nfa_state in states if code in self._codes[nfa_state]]
+                )
+                # Пустое множество становится явным состоянием отказа, автомат полный
+                if target not in names:
+                    if len(names) >= limit:
+                        raise ValueError(f"Полный DFA содержит больше {limit} состояний")
+                    names[target] = f'd{len(names)}'
+                    queue.append(target)
+                moves[symbol] = names[target]
+            transitions[names[states]] = moves
+
+        return {
+            'initial_state': 'd0',
+            'accept_states': {name for states, name in names.items() if self.nfa.accept in states},
+            'alphabet': set(self.alphabet),
+            'transitions': dict(sorted(transitions.items(), key=lambda item: int(item[0][1:]))),
+        }
+
+
+def compile_regex(pattern: str, alphabet: Optional[Set[str]] = None,
+                  max_states: int = DEFAULT_MAX_STATES) -> LazyDFA:
+    """
+    Компилирует регулярное выражение в ленивый DFA (выражение должно совпасть со всей строкой).
+
+    Args:
+        pattern: Регулярное выражение
+        alphabet: Алфавит (по умолчанию - символы выражения)
+        max_states: Наибольшее количество состояний DFA в кеше
+    """
+    nfa, alphabet = regex_to_nfa(pattern, alphabet)
+    return LazyDFA(nfa, alphabet, max_states)
@@ -0,0 +1,242 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from CompiledDFA import BYTE_VALUES, CompiledDFA
+from Regex import DEFAULT_MAX_STATES, UNKNOWN, NFA, LazyDFA
+
+# Размер порции при чтении файла в режиме поиска
+DEFAULT_CHUNK_SIZE = 1 << 20
+# Любой байт: автомат Σ*·L пропускает и символы не из алфавита
+ANY_BYTE = frozenset(chr(code) for code in range(BYTE_VALUES))
+
+
+def dfa_to_nfa(initial_state: str, accept_states: Set[str], alphabet: Set[str],
+               transitions: Dict[str, Dict[str, str]]) -> NFA:
+    """
+    Строит NFA для поиска: Σ*·L.
+
+    Каждый переход DFA q --a--> p становится промежуточным состоянием NFA;
+    перед начальными состояниями добавляется петля по любому байту, поэтому
+    совпадение может начаться в любой позиции.
+
+    Args:
+        initial_state: Начальное состояние DFA
+        accept_states: Принимающие состояния DFA
+        alphabet: Алфавит DFA
+        transitions: Таблица переходов DFA
+
+    Returns:
+        NFA с единственным принимающим состоянием
+    """
+    nfa = NFA()
+    node = {state: nfa.add_state() for state in transitions}
+
+    for state, moves in transitions.items():
+        for symbol, target in moves.items():
+            if symbol not in alphabet:
+                continue
+            edge = nfa.add_state()
+            nfa.symbols[edge] = frozenset(symbol)
+            nfa.targets[edge] = node[target]
+            nfa.epsilon[node[state]].append(edge)
+
+    nfa.start = nfa.add_state()
+    nfa.epsilon[nfa.start].append(node[initial_state])
+    loop = nfa.add_state()
+    nfa.symbols[loop] = ANY_BYTE
+    nfa.targets[loop] = nfa.start
+    nfa.epsilon[nfa.start].append(loop)
+
+    nfa.accept = nfa.add_state()
+    for state in accept_states:
+        nfa.epsilon[node[state]].append(nfa.accept)
+    return nfa
+
+
+class DFASearcher:
+    """
+    Поиск в потоке всех позиций, где заканчивается слово языка автомата.
+
+    Автомат Σ*·L строится из DFA лениво (подмножествами состояний) и
+    работает по таблице. Для совпадений по правилу "самое левое, затем
+    самое длинное" текст один раз проходится справа налево: для каждой
+    позиции p строится маска R_p состояний DFA, из которых принимается
+    некоторый префикс data[p:]. Маски - состояния ленивого обратного
+    автомата подмножеств, R_p = F ∪ {q: δ(q, data[p]) ∈ R_(p+1)}. Начало
+    совпадения - позиция, где в R_p есть начальное состояние, а прогон от
+    начала останавливается сразу после самого длинного конца, поэтому
+    поиск всех совпадений линеен по длине текста.
+    """
+
+    def __init__(self, initial_state: str, accept_states: Set[str], alphabet: Set[str],
+                 transitions: Dict[str, Dict[str, str]], compiled: Optional[CompiledDFA] = None,
+                 max_states: int = DEFAULT_MAX_STATES):
+        """
+        Args:
+            initial_state: Начальное состояние DFA
+            accept_states: Принимающие состояния DFA
+            alphabet: Алфавит DFA
+            transitions: Таблица переходов DFA
+            compiled: Скомпилированный DFA для поиска концов от известного начала
+            max_states: Наибольшее количество состояний в кешах ленивых автоматов
+        """
+        definition = (initial_state, accept_states, alphabet, transitions)
+        self.forward = LazyDFA(dfa_to_nfa(*definition), alphabet, max_states)
+        self.compiled = compiled or CompiledDFA(*definition)
+        self.max_states = max(2, max_states)
+        self._table = self.compiled.table.tolist()
+        self._accepting = self.compiled.accepting.tolist()
+        self._flush_masks()
+
+    def _flush_masks(self) -> None:
+        """Очищает кеш масок обратного автомата, оставляя только маску F."""
+        final = self.compiled.accepting.tobytes()
+        self._masks: List[bytes] = [final]
+        self._mask_index: Dict[bytes, int] = {final: 0}
+        self._mask_rows: List[List[int]] = [[UNKNOWN] * BYTE_VALUES]
+
+    def _intern_mask(self, mask: bytes) -> int:
+        """Возвращает номер маски в кеше, добавляя ее при необходимости."""
+        index = self._mask_index.get(mask)
+        if index is None:
+            index = len(self._masks)
+            self._masks.append(mask)
+            self._mask_index[mask] = index
+            self._mask_rows.append([UNKNOWN] * BYTE_VALUES)
+        return index
+
+    def _mask_step(self, index: int, byte: int) -> int:
+        """Вычисляет маску R_p по маске R_(p+1) и байту data[p] (со сбросом переполненного кеша)."""
+        following = np.frombuffer(self._masks[index], dtype=bool)
+        mask = (self.compiled.accepting | following[self.compiled.table[:, byte]]).tobytes()
+
+        if mask not in self._mask_index and len(self._masks) >= self.max_states:
+            current = self._masks[index]
+            self._flush_masks()
+            index = self._intern_mask(current)
+
+        next_index = self._intern_mask(mask)
+        self._mask_rows[index][byte] = next_index
+        return next_index
+
+    def _suffix_masks(self, data: bytes) -> List[bytes]:
+        """
+        Вычисляет маски R_p для всех позиций проходом справа налево.
+
+        Returns:
+            Список длины len(data) + 1: masks[p][q] = 1, если из состояния q
+            принимается некоторый префикс data[p:]
+        """
+        masks: List[bytes] = [b''] * (len(data) + 1)
+        index = 0
+        masks[len(data)] = self._masks[index]
+        rows = self._mask_rows
+        for position in range(len(data) - 1, -1, -1):
+            next_index = rows[index][data[position]]
+            if next_index == UNKNOWN:
+                next_index = self._mask_step(index, data[position])
+                rows = self._mask_rows
+            index = next_index
+            masks[position] = self._masks[index]
+        return masks
+
+    def iter_match_ends(self, source: Union[bytes, str, Iterable[bytes]],
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[int]:
+        """
+        Перебирает позиции концов всех совпадений (включая перекрывающиеся).
+
+        Args:
+            source: Байты, имя файла или последовательность порций байтов
+            chunk_size: Размер порции при чтении файла
+
+        Yields:
+            Смещения e: некоторое слово data[s:e] принадлежит языку
+        """
+        state = self.forward.initial_state
+        if self.forward.is_accepting(state):
+            yield 0
+
+        offset = 0
+        for chunk in _iter_chunks(source, chunk_size):
+            positions, state = self.forward.scan(chunk, state)
+            for position in positions:
+                yield offset + position
+            offset += len(chunk)
+
+    def match_starts(self, data: bytes) -> bytearray:
+        """
+        Отмечает позиции, с которых начинается хотя бы одно совпадение.
+
+        Returns:
+            Массив длины len(data) + 1, 1 - в позиции начинается совпадение
+        """
+        initial = self.compiled.initial_state
+        return bytearray(mask[initial] for mask in self._suffix_masks(data))
+
+    def _longest_end(self, data: bytes, start: int, masks: List[bytes]) -> int:
+        """Прогон от start, пока впереди еще возможен принимающий конец."""
+        table, accepting = self._table, self._accepting
+        state = self.compiled.initial_state
+        end = start if accepting[state] else -1
+
+        for position in range(start, len(data)):
+            state = table[state][data[position]]
+            # Дальше position + 1 ни один конец не достижим - самый длинный уже найден
+            if not masks[position + 1][state]:
+                break
+            if accepting[state]:
+                end = position + 1
+        return end
+
+    def longest_match_end(self, data: bytes, start: int) -> int:
+        """
+        Находит конец самого длинного совпадения, начинающегося в позиции start.
+
+        Returns:
+            Смещение конца или -1, если совпадения с этого начала нет
+        """
+        masks = self._suffix_masks(data[start:])
+        end = self._longest_end(data[start:], 0, masks)
+        return end + start if end != -1 else -1
+
+    def iter_matches(self, data: bytes) -> Iterator[Tuple[int, int]]:
+        """
+        Перебирает непересекающиеся совпадения: самое левое начало, затем самый длинный конец.
+
+        Один проход справа налево строит маски, затем каждый байт читается
+        прогоном от начала не больше одного раза (плюс байт после конца).
+
+        Args:
+            data: Входные байты
+
+        Yields:
+            Пары (начало, конец): data[начало:конец] принадлежит языку
+        """
+        masks = self._suffix_masks(data)
+        initial = self.compiled.initial_state
+        starts = bytearray(mask[initial] for mask in masks)
+        position = 0
+        while position <= len(data):
+            start = starts.find(1, position)
+            if start == -1:
+                return
+            end = self._longest_end(data, start, masks)
+            yield start, end
+            # Пустое совпадение: следующий поиск начинается со следующей позиции
+            position = end if end > start else start + 1
+
+
+def _iter_chunks(source: Union[bytes, str, Iterable[bytes]], chunk_size: int) -> Iterator[bytes]:
+    """Разбивает источник на порции байтов."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield source
+    elif isinstance(source, str):
+        with open(source, 'rb') as file:
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+    else:
+        yield from source
@@ -0,0 +1,203 @@
+import mmap
+import os
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from CompiledDFA import CompiledDFA
+
+# Размер окна файла, обрабатываемого за один раз
+DEFAULT_WINDOW = 16 << 20
+# Наименьший размер окна: '\r' на краю окна переносится в следующее вместе с '\n'
+MIN_WINDOW = 2
+# Слова не длиннее этого обрабатываются все сразу, по одной позиции за шаг
+LOCKSTEP_LIMIT = 256
+WHITESPACE = b' \t\r\n\x0b\x0c'
+
+
+def _window_end(data: mmap.mmap, start: int, window: int, delimiter: Optional[bytes]) -> Tuple[int, bool]:
+    """
+    Находит конец окна: сразу после последнего разделителя (или конец файла).
+
+    Returns:
+        Кортеж (конец окна, заканчивается ли в окне хотя бы одно слово);
+        False - окно целиком занято частью длинного слова
+    """
+    size = len(data)
+    end = start + window
+    if end >= size:
+        return size, True
+
+    separators = WHITESPACE if delimiter is None else delimiter
+    last = max(data.rfind(separator, start, end) for separator in (bytes([byte]) for byte in separators))
+    if last >= start:
+        return last + 1, True
+
+    # Окно не продлевается: слово дочитывается в следующих окнах. '\r' перед
+    # возможным '\n' оставляется следующему окну, чтобы отбросить его вместе с '\n'
+    if delimiter == b'\n' and data[end - 1] == ord('\r'):
+        end -= 1
+    return end, False
+
+
+def _word_bounds(buffer: np.ndarray, delimiter: Optional[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Находит границы слов в окне.
+
+    Returns:
+        Кортеж (начала слов, концы слов)
+    """
+    if delimiter is None:
+        is_space = np.isin(buffer, np.frombuffer(WHITESPACE, dtype=np.uint8))
+        edges = np.diff(np.concatenate([[True], is_space, [True]]).astype(np.int8))
+        return np.flatnonzero(edges == -1), np.flatnonzero(edges == 1)
+
+    separators = np.flatnonzero(buffer == delimiter[0])
+    starts = np.concatenate([[0], separators + 1])
+    stops = np.concatenate([separators, [len(buffer)]])
+    if starts[-1] == len(buffer):
+        # Разделитель в конце окна не начинает нового слова
+        starts, stops = starts[:-1], stops[:-1]
+
+    if delimiter == b'\n':
+        # Строки с окончанием \r\n
+        carriage = (stops > starts) & (buffer[np.maximum(stops - 1, 0)] == ord('\r'))
+        stops = stops - carriage
+    return starts, stops
+
+
+def _run_words(compiled: CompiledDFA, buffer: np.ndarray, starts: np.ndarray, stops: np.ndarray,
+               carry: Optional[int] = None) -> np.ndarray:
+    """
+    Вычисляет конечные состояния для всех слов окна.
+
+    Короткие слова обрабатываются одновременно: на шаге p все слова длиннее p
+    делают p-й переход одной операцией NumPy. Длинные слова - по отдельности,
+    одним проходом по таблице от начального состояния.
+
+    Args:
+        carry: Состояние слова, начатого в предыдущих окнах: первое слово окна
+            продолжает его, а если окно начинается с разделителя - это слово
+            уже закончилось и его состояние идет первым в результате
+    """
+    lengths = stops - starts
+    states = np.full(len(starts), compiled.initial_state, dtype=np.int32)
+    if carry is not None and len(starts) and starts[0] == 0:
+        states[0] = carry
+
+    for word in np.flatnonzero(lengths > LOCKSTEP_LIMIT):
+        states[word] = compiled.run(buffer[starts[word]:stops[word]].data, int(states[word]))
+
+    short = np.flatnonzero(lengths <= LOCKSTEP_LIMIT)
+    order = short[np.argsort(-lengths[short], kind='stable')]
+    sorted_lengths = lengths[order]
+    sorted_starts = starts[order]
+    current = states[order]
+
+    # Слова отсортированы по убыванию длины: активные образуют префикс
+    for position in range(int(sorted_lengths[0]) if len(order) else 0):
+        active = np.searchsorted(-sorted_lengths, -position, side='left')
+        current[:active] = compiled.table[current[:active], buffer[sorted_starts[:active] + position]]
+
+    states[order] = current
+    if carry is not None and not (len(starts) and starts[0] == 0):
+        states = np.concatenate([np.array([carry], dtype=np.int32), states])
+    return states
+
+
+def scan_file(compiled: CompiledDFA, filename: str, delimiter: Optional[bytes] = b'\n',
+              window: int = DEFAULT_WINDOW) -> Iterator[np.ndarray]:
+    """
+    Прогоняет автомат по всем словам файла, не создавая строк Python.
+
+    Файл отображается в память и обрабатывается окнами не больше window байт,
+    поэтому память ограничена размером окна независимо от размера файла.
+    Слово длиннее окна дочитывается в следующих окнах, между ними
+    переносится только состояние автомата.
+
+    Args:
+        compiled: Скомпилированный автомат
+        filename: Путь к файлу
+        delimiter: Однобайтовый разделитель слов (по умолчанию - строки);
+            None - слова разделяются пробельными символами
+        window: Размер окна в байтах (не меньше MIN_WINDOW)
+
+    Yields:
+        Массивы конечных состояний слов очередного окна в порядке следования
+    """
+    if delimiter is not None and len(delimiter) != 1:
+        raise ValueError("Разделитель должен состоять из одного байта")
+    if window < MIN_WINDOW:
+        raise ValueError(f"Размер окна должен быть не меньше {MIN_WINDOW} байт")
+    if not os.path.getsize(filename):
+        return
+
+    with open(filename, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        # Состояние недочитанного слова из предыдущих окон
+        carry = None
+        while start < len(data):
+            end, complete = _window_end(data, start, window, delimiter)
+            buffer = np.frombuffer(data, dtype=np.uint8, count=end - start, offset=start)
+            if complete:
+                starts, stops = _word_bounds(buffer, delimiter)
+                states = _run_words(compiled, buffer, starts, stops, carry)
+                carry = None
+            else:
+                carry = compiled.run(buffer.data, compiled.initial_state if carry is None else carry)
+            del buffer
+            if complete:
+                yield states
+            start = end
+
+
+def iter_acceptance(compiled: CompiledDFA, filename: str, delimiter: Optional[bytes] = b'\n',
+                    window: int = DEFAULT_WINDOW) -> Iterator[np.ndarray]:
+    """
+    Результаты распознавания слов файла.
+
+    Yields:
+        Булевы массивы (принято ли слово) для очередного окна; слова
+        с недопустимыми символами не принимаются
+    """
+    for states in scan_file(compiled, filename, delimiter, window):
+        yield compiled.accepting[states]
+
+
+def write_bitmap(compiled: CompiledDFA, filename: str, output_file: str,
+                 delimiter: Optional[bytes] = b'\n', window: int = DEFAULT_WINDOW) -> Dict[str, int]:
+    """
+    Записывает результаты распознавания слов файла в виде битовой карты.
+
+    Бит i (порядок битов в байте - от младшего) равен 1, если i-е слово принято.
+
+    Args:
+        compiled: Скомпилированный автомат
+        filename: Путь к входному файлу
+        output_file: Путь к файлу битовой карты
+        delimiter: Разделитель слов, как в scan_file
+        window: Размер окна в байтах
+
+    Returns:
+        Словарь с количеством слов, принятых слов и слов с ошибками
+    """
+    summary = {'words': 0, 'accepted': 0, 'errors': 0}
+    pending = np.zeros(0, dtype=bool)
+
+    with open(output_file, 'wb') as output:
+        for states in scan_file(compiled, filename, delimiter, window):
+            accepted = compiled.accepting[states]
+            summary['words'] += len(states)
+            summary['accepted'] += int(accepted.sum())
+            summary['errors'] += int((states == compiled.error_state).sum())
+
+            # В файл пишутся только полные байты, остаток переносится в следующее окно
+            bits = np.concatenate([pending, accepted])
+            complete = len(bits) - len(bits) % 8
+            output.write(np.packbits(bits[:complete], bitorder='little').tobytes())
+            pending = bits[complete:]
+
+        if len(pending):
+            output.write(np.packbits(pending, bitorder='little').tobytes())
+
+    return summary
@@ -1,5 +1,7 @@
+import sys
+
 from setup import run
 
 
 if __name__ == "__main__":
-    run()
+    run(sys.argv[1] if len(sys.argv) > 1 else None)
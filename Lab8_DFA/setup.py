@@ -1,10 +1,18 @@
+from typing import Optional
+
 from DFA import DFA, DFATester
 
-def run():
-    """Основная функция программы."""
+def run(definition_file: Optional[str] = None):
+    """
+    Основная функция программы.
+
+    Args:
+        definition_file: Файл с определением автомата (JSON или .dfa),
+            по умолчанию используется встроенный автомат
+    """
     try:
         # Создаем автомат
-        dfa = DFA()
+        dfa = DFA.from_file(definition_file) if definition_file else DFA()
         tester = DFATester(dfa)
 
         # Тестовые слова
@@ -23,5 +31,9 @@ def run():
         print(f"Принимающие состояния: {dfa.accept_states}")
         print(f"Все состояния: {list(dfa.transitions.keys())}")
 
+        minimal, report = dfa.minimize()
+        print(f"Минимальный автомат: {report['states_after']} состояний из {report['states_before']}, "
+              f"соответствие состояний: {report['mapping']}")
+
     except Exception as e:
         print(f"Ошибка при создании автомата: {e}")